@@ -24,6 +24,9 @@ from aiortc import RTCPeerConnection, RTCSessionDescription
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("multi_camera_client")
 
+# Blending weights are 8-bit pixel fractions; float32 is plenty and halves bandwidth
+BLEND_DTYPE = np.float32
+
 # Import demo mode and connection dialog
 try:
     from demo_mode import DemoCameraManager
@@ -65,6 +68,9 @@ class MultiCameraManager:
         self.running = True
         self.ir_threshold = 200
         self.demo_manager = None
+        self._camera_by_position: Dict[Tuple[int, int], str] = {}
+        self._feather_ramps: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._composite_buf: Optional[np.ndarray] = None
         
         # Load configuration
         self.load_config()
@@ -95,6 +101,7 @@ class MultiCameraManager:
                     camera = CameraConfig(**camera_data)
                     self.cameras[camera.camera_id] = camera
             
+            self._rebuild_position_index()
             logger.info(f"Loaded {len(self.cameras)} cameras from {self.config_file}")
             
         except Exception as e:
@@ -116,7 +123,7 @@ class MultiCameraManager:
         return {}
             
     def create_composite_frame(self) -> Optional[np.ndarray]:
-        """Create a composite frame from all enabled cameras"""
+        """Create a composite frame from all enabled cameras (the buffer is reused; copy to keep it)"""
         enabled_cameras = {k: v for k, v in self.cameras.items() if v.enabled}
         
         if not enabled_cameras:
@@ -135,8 +142,13 @@ class MultiCameraManager:
         composite_width = self.grid_config.cameras_per_row * self.grid_config.cell_width
         composite_height = ((len(enabled_cameras) + self.grid_config.cameras_per_row - 1) // self.grid_config.cameras_per_row) * self.grid_config.cell_height
         
-        # Create black canvas
-        composite = np.zeros((composite_height, composite_width, 3), dtype=np.uint8)
+        # Clear the reusable canvas, reallocating only when the layout changes
+        composite_shape = (composite_height, composite_width, 3)
+        composite = self._composite_buf
+        if composite is None or composite.shape != composite_shape:
+            composite = self._composite_buf = np.zeros(composite_shape, dtype=np.uint8)
+        else:
+            composite.fill(0)
         
         # Use appropriate lock
         if self.demo_mode:
@@ -261,11 +273,15 @@ class MultiCameraManager:
         grid_x = x // self.grid_config.cell_width
         grid_y = y // self.grid_config.cell_height
         
+        return self._camera_by_position.get((grid_x, grid_y), "unknown")
+    
+    def _rebuild_position_index(self):
+        """Index enabled cameras by grid cell for O(1) position lookups"""
+        self._camera_by_position = {}
         for camera_id, config in self.cameras.items():
-            if config.enabled and config.position == (grid_x, grid_y):
-                return camera_id
-        
-        return "unknown"
+            if config.enabled:
+                # Positions loaded from JSON are lists; normalise to tuples
+                self._camera_by_position.setdefault(tuple(config.position), camera_id)
         
     def apply_seamless_blending(self, composite_frame: np.ndarray) -> np.ndarray:
         """Apply seamless blending to eliminate visible seams between cameras"""
@@ -273,6 +289,9 @@ class MultiCameraManager:
             return None
         
         blended = composite_frame.copy()
+        cameras_per_row = self.grid_config.cameras_per_row
+        enabled_count = sum(1 for c in self.cameras.values() if c.enabled)
+        total_rows = (enabled_count + cameras_per_row - 1) // cameras_per_row
         
         # Apply feathering at camera boundaries
         for camera_id, config in self.cameras.items():
@@ -286,33 +305,51 @@ class MultiCameraManager:
             end_y = start_y + self.grid_config.cell_height
             
             # Apply feathering on right edge (if not last column)
-            if grid_x < self.grid_config.cameras_per_row - 1:
+            if grid_x < cameras_per_row - 1:
                 feather_width = int(self.grid_config.cell_width * config.overlap_threshold)
-                if feather_width > 0:
-                    for i in range(feather_width):
-                        alpha = (feather_width - i) / feather_width
-                        x_pos = end_x - feather_width + i
-                        if x_pos < composite_frame.shape[1]:
-                            blended[start_y:end_y, x_pos] = (
-                                alpha * blended[start_y:end_y, x_pos] +
-                                (1 - alpha) * composite_frame[start_y:end_y, x_pos]
-                            ).astype(np.uint8)
+                x0 = end_x - feather_width
+                x1 = min(end_x, composite_frame.shape[1])
+                if feather_width > 0 and x1 > x0:
+                    # Blend every feathered column in one pass
+                    alpha, inv_alpha = self._get_feather_ramp(feather_width)
+                    alpha = alpha[np.newaxis, :x1 - x0, np.newaxis]
+                    inv_alpha = inv_alpha[np.newaxis, :x1 - x0, np.newaxis]
+                    self._blend_band(blended[start_y:end_y, x0:x1],
+                                     composite_frame[start_y:end_y, x0:x1],
+                                     alpha, inv_alpha)
             
             # Apply feathering on bottom edge (if not last row)
-            total_rows = (len([c for c in self.cameras.values() if c.enabled]) + self.grid_config.cameras_per_row - 1) // self.grid_config.cameras_per_row
             if grid_y < total_rows - 1:
                 feather_height = int(self.grid_config.cell_height * config.overlap_threshold)
-                if feather_height > 0:
-                    for i in range(feather_height):
-                        alpha = (feather_height - i) / feather_height
-                        y_pos = end_y - feather_height + i
-                        if y_pos < composite_frame.shape[0]:
-                            blended[y_pos, start_x:end_x] = (
-                                alpha * blended[y_pos, start_x:end_x] +
-                                (1 - alpha) * composite_frame[y_pos, start_x:end_x]
-                            ).astype(np.uint8)
+                y0 = end_y - feather_height
+                y1 = min(end_y, composite_frame.shape[0])
+                if feather_height > 0 and y1 > y0:
+                    # Blend every feathered row in one pass
+                    alpha, inv_alpha = self._get_feather_ramp(feather_height)
+                    alpha = alpha[:y1 - y0, np.newaxis, np.newaxis]
+                    inv_alpha = inv_alpha[:y1 - y0, np.newaxis, np.newaxis]
+                    self._blend_band(blended[y0:y1, start_x:end_x],
+                                     composite_frame[y0:y1, start_x:end_x],
+                                     alpha, inv_alpha)
         
         return blended
+    
+    @staticmethod
+    def _blend_band(dst: np.ndarray, src: np.ndarray, alpha: np.ndarray, inv_alpha: np.ndarray):
+        """Blend src into dst in place (dst = alpha * dst + inv_alpha * src) without extra temporaries"""
+        acc = np.multiply(dst, alpha, dtype=BLEND_DTYPE)
+        tmp = np.multiply(src, inv_alpha, dtype=BLEND_DTYPE)
+        np.add(acc, tmp, out=acc)
+        np.copyto(dst, acc, casting='unsafe')
+    
+    def _get_feather_ramp(self, length: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return cached (alpha, 1 - alpha) feather weights for a band of the given length"""
+        ramp = self._feather_ramps.get(length)
+        if ramp is None:
+            alpha = np.arange(length, 0, -1, dtype=BLEND_DTYPE) * BLEND_DTYPE(1.0 / length)
+            ramp = (alpha, 1 - alpha)
+            self._feather_ramps[length] = ramp
+        return ramp
 
 async def receive_track_for_camera(track, camera_id: str, manager: MultiCameraManager):
     """Process incoming video track frames for a specific camera"""
@@ -546,11 +583,13 @@ async def run_multi_camera_client(config_file: str, dry_run: bool = False):
         
         # Wait for all connections
         results = await asyncio.gather(*connection_tasks, return_exceptions=True)
-        successful_connections = sum(1 for result in results if result is True)
-        failed_cameras = [
-            enabled_cameras[i].camera_id for i, result in enumerate(results) 
-            if result is not True
-        ]
+        successful_connections = 0
+        failed_cameras = []
+        for camera_config, result in zip(enabled_cameras, results):
+            if result is True:
+                successful_connections += 1
+            else:
+                failed_cameras.append(camera_config.camera_id)
         
         logger.info(f"Connected to {successful_connections}/{len(connection_tasks)} cameras")
         
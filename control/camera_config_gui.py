@@ -22,6 +22,13 @@ import asyncio
 import aiohttp
 from aiortc import RTCPeerConnection, RTCSessionDescription
 
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 @dataclass
 class CameraConfig:
     """Configuration for a single camera"""
@@ -645,8 +652,7 @@ Auto Crop: {camera.auto_crop}"""
                         resized_frame = cv2.resize(cropped_frame, preview_size)
                         
                         # Convert to PhotoImage
-                        rgb_frame = cv2.cvtColor(resized_frame, cv2.COLOR_BGR2RGB)
-                        pil_image = Image.fromarray(rgb_frame)
+                        pil_image = Image.frombuffer('RGB', preview_size, resized_frame, 'raw', 'BGR', 0, 1)
                         photo = ImageTk.PhotoImage(pil_image)
                         
                         # Update label
@@ -664,6 +670,12 @@ Auto Crop: {camera.auto_crop}"""
         def test_connections():
             results = []
             for camera_id, camera in self.cameras.items():
+                # A live preview connection already proves the camera is reachable
+                pc = self.camera_connections.get(camera_id)
+                if pc is not None and pc.connectionState == "connected":
+                    results.append(f"✓ {camera_id}: Connected (preview active)")
+                    continue
+                
                 try:
                     # Simple HTTP test
                     import urllib.request
@@ -715,8 +727,12 @@ Auto Crop: {camera.auto_crop}"""
                 'cameras': [asdict(camera) for camera in self.cameras.values()]
             }
             
-            with open(self.config_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.config_file, 'w') as f:
+                    json.dump(data, f, indent=2)
             
             print(f"Saved configuration to {self.config_file}")
             messagebox.showinfo("Success", f"Configuration saved to {self.config_file}")
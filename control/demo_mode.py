@@ -9,8 +9,9 @@ import numpy as np
 import time
 import math
 import random
-import threading
 import logging
+import multiprocessing as mp
+from multiprocessing import shared_memory
 from typing import Dict, List, Tuple, Optional
 
 logger = logging.getLogger("demo_mode")
@@ -108,17 +109,50 @@ class DemoVideoGenerator:
         self.frame_count += 1
         return frame
 
+def _demo_capture_worker(camera_id: str, width: int, height: int, shm_name: str,
+                         frame_lock, ready_evt, stop_evt, fps: int = 15):
+    """Generate demo frames in a child process and publish them to shared memory"""
+    # Forked workers inherit the parent's RNG state; reseed so feeds differ
+    random.seed()
+    np.random.seed()
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    shared_arr = np.ndarray((height, width, 3), dtype=np.uint8, buffer=shm.buf)
+    generator = DemoVideoGenerator(width, height)
+    frame_time = 1.0 / fps
+
+    try:
+        while not stop_evt.is_set():
+            start_time = time.time()
+
+            frame = generator.generate_frame()
+            with frame_lock:
+                np.copyto(shared_arr, frame)
+            ready_evt.set()
+
+            # Maintain FPS
+            elapsed = time.time() - start_time
+            stop_evt.wait(max(0, frame_time - elapsed))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        logger.error(f"Demo feed for camera {camera_id} stopped: {e}")
+    finally:
+        del shared_arr
+        shm.close()
+
 class DemoCameraManager:
     """Manages multiple demo camera feeds"""
     
     def __init__(self, camera_configs: Dict):
         self.camera_configs = camera_configs
-        self.generators = {}
-        self.latest_frames = {}
-        self.frame_lock = threading.Lock()
+        self.frame_sizes = {}
+        self.shared_frames = {}
+        self.processes = []
+        self.stop_event = mp.Event()
         self.running = True
         
-        # Initialize generators for each camera
+        # Work out frame sizes for each camera
         for camera_id, config in camera_configs.items():
             if config.enabled:
                 # Use crop dimensions if available, otherwise default
@@ -126,50 +160,60 @@ class DemoCameraManager:
                 width = crop_rect[2] if crop_rect[2] > 0 else 640
                 height = crop_rect[3] if crop_rect[3] > 0 else 480
                 
-                self.generators[camera_id] = DemoVideoGenerator(width, height)
+                self.frame_sizes[camera_id] = (width, height)
         
-        # Start generation threads
-        self.start_generation_threads()
+        # Start generation processes
+        self.start_generation_processes()
     
-    def start_generation_threads(self):
-        """Start frame generation threads for each camera"""
-        for camera_id, generator in self.generators.items():
-            thread = threading.Thread(
-                target=self.generate_frames_for_camera,
-                args=(camera_id, generator),
+    def start_generation_processes(self):
+        """Start a frame generation process per camera, each writing to its own shared buffer"""
+        for camera_id, (width, height) in self.frame_sizes.items():
+            shm = shared_memory.SharedMemory(create=True, size=width * height * 3)
+            shared_arr = np.ndarray((height, width, 3), dtype=np.uint8, buffer=shm.buf)
+            frame_lock = mp.Lock()
+            ready_evt = mp.Event()
+            
+            process = mp.Process(
+                target=_demo_capture_worker,
+                args=(camera_id, width, height, shm.name, frame_lock, ready_evt, self.stop_event),
+                name=f"demo-feed-{camera_id}",
                 daemon=True
             )
-            thread.start()
-            logger.info(f"Started demo feed for camera {camera_id}")
-    
-    def generate_frames_for_camera(self, camera_id: str, generator: DemoVideoGenerator):
-        """Generate frames for a specific camera"""
-        fps = 15  # Reduced FPS for better performance
-        frame_time = 1.0 / fps
-        
-        while self.running:
-            start_time = time.time()
-            
-            # Generate frame
-            frame = generator.generate_frame()
+            process.start()
             
-            # Store frame
-            with self.frame_lock:
-                self.latest_frames[camera_id] = frame
-            
-            # Maintain FPS
-            elapsed = time.time() - start_time
-            sleep_time = max(0, frame_time - elapsed)
-            time.sleep(sleep_time)
+            self.shared_frames[camera_id] = (shm, shared_arr, frame_lock, ready_evt)
+            self.processes.append(process)
+            logger.info(f"Started demo feed for camera {camera_id} (pid {process.pid})")
     
     def get_latest_frames(self) -> Dict[str, np.ndarray]:
         """Get latest frames from all cameras"""
-        with self.frame_lock:
-            return self.latest_frames.copy()
+        frames = {}
+        for camera_id, (_, shared_arr, frame_lock, ready_evt) in self.shared_frames.items():
+            if not ready_evt.is_set():
+                continue
+            with frame_lock:
+                frames[camera_id] = shared_arr.copy()
+        return frames
     
     def stop(self):
-        """Stop all generation threads"""
+        """Stop all generation processes and release shared memory"""
+        if not self.running:
+            return
         self.running = False
+        self.stop_event.set()
+        
+        for process in self.processes:
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.terminate()
+        self.processes.clear()
+        
+        while self.shared_frames:
+            _, (shm, shared_arr, _, _) = self.shared_frames.popitem()
+            del shared_arr
+            shm.close()
+            shm.unlink()
+        
         logger.info("Stopped all demo camera feeds")
 
 if __name__ == "__main__":
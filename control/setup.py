@@ -17,23 +17,8 @@ def run_command(command, description, verbose=False):
     
     try:
         if verbose:
-            # For verbose output, stream the output in real-time
-            process = subprocess.Popen(
-                command, 
-                shell=True, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            # Print output in real-time
-            if process.stdout:
-                for line in process.stdout:
-                    print(f"   {line.rstrip()}")
-            
-            process.wait()
+            # For verbose output, let the command write straight to the terminal
+            process = subprocess.run(command, shell=True)
             
             if process.returncode == 0:
                 print(f"✅ {description} completed successfully")
@@ -28,6 +28,7 @@ class VideoDisplayGUI:
         # Video display variables
         self.video_label = None
         self.current_frame = None
+        self._click_scale = None
         self.display_thread = None
         self.running = False
         
@@ -215,13 +216,8 @@ class VideoDisplayGUI:
             label_width = self.video_label.winfo_width()
             label_height = self.video_label.winfo_height()
             
-            if hasattr(self, 'display_image') and self.display_image:
-                img_width = self.display_image.width()
-                img_height = self.display_image.height()
-                
-                # Calculate scale factors
-                scale_x = self.current_frame.shape[1] / img_width
-                scale_y = self.current_frame.shape[0] / img_height
+            if self._click_scale:
+                scale_x, scale_y = self._click_scale
                 
                 # Convert click coordinates to frame coordinates
                 frame_x = int(event.x * scale_x)
@@ -260,8 +256,10 @@ class VideoDisplayGUI:
         """Main display loop running in separate thread"""
         frame_count = 0
         fps_start_time = time.time()
+        frame_time = 1 / 30  # ~30 FPS
         
         while self.running:
+            loop_start = time.perf_counter()
             try:
                 # Get composite frame from camera manager
                 composite_frame = self.camera_manager.create_composite_frame()
@@ -284,7 +282,9 @@ class VideoDisplayGUI:
                     # No frame available
                     self.display_no_feed_message()
                     
-                time.sleep(1/30)  # ~30 FPS
+                # Sleep only for whatever is left of the frame budget
+                elapsed = time.perf_counter() - loop_start
+                time.sleep(max(0, frame_time - elapsed))
                 
             except Exception as e:
                 logger.error(f"Error in display loop: {e}")
@@ -393,11 +393,9 @@ class VideoDisplayGUI:
     def display_frame(self, frame: np.ndarray):
         """Display frame in the GUI"""
         try:
-            # Convert BGR to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Convert to PIL Image
-            pil_image = Image.fromarray(rgb_frame)
+            # Convert to PIL Image, letting the raw decoder swap BGR to RGB
+            frame = np.ascontiguousarray(frame)
+            pil_image = Image.frombuffer('RGB', (frame.shape[1], frame.shape[0]), frame, 'raw', 'BGR', 0, 1)
             
             # Resize to fit display area while maintaining aspect ratio
             display_width = 800
@@ -419,6 +417,9 @@ class VideoDisplayGUI:
             # Update label
             self.video_label.configure(image=self.display_image, text="")
             self.current_frame = frame
+            # Display-to-frame ratios used to map clicks back onto the frame
+            frame_height, frame_width = frame.shape[:2]
+            self._click_scale = (frame_width / new_width, frame_height / new_height)
             
         except Exception as e:
             logger.error(f"Error displaying frame: {e}")
@@ -0,0 +1,12 @@
+"""
+Requirement-to-module names shared by the launcher and the launcher GUI
+"""
+
+# Requirement names whose import name differs from the distribution name
+IMPORT_NAMES = {
+    'opencv-python': 'cv2',
+    'opencv-contrib-python': 'cv2',
+    'pillow': 'PIL',
+    'pil': 'PIL',
+    'scikit-image': 'skimage'
+}
@@ -5,16 +5,193 @@ InstallShield-style wizard with Back/Next navigation
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import json
+from tkinter import ttk, scrolledtext, filedialog
 import os
+import codecs
+import re
+import shutil
+import platform
 import sys
 import subprocess
 import threading
-import time
+import queue
 from pathlib import Path
 from datetime import datetime
-import webbrowser
+import functools
+
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# Paths and platform, resolved once at import
+_HERE = Path(__file__).resolve().parent
+_ROOT = _HERE.parent
+_SYSTEM = platform.system()
+_LAUNCHER = _ROOT / "launcher.py"
+_README = _ROOT / "README.md"
+
+_WELCOME_TEXT = """This wizard will guide you through the installation of the Automated Followspot System.
+
+The Automated Followspot System is a multi-camera IR beacon tracking solution designed for live performance applications.
+
+Before you begin:
+• Ensure you have Python 3.7 or later installed
+• Make sure you have an active internet connection for downloading dependencies
+• Close any other Python applications that might interfere
+• Optional: run "pip install uv" first for much faster dependency installation
+
+Click Next to continue with the installation."""
+
+_CONTROL_DESC = """• Camera management and tracking interface
+• Real-time video processing and IR beacon detection
+• Multi-camera composite display
+• Configuration tools and demo mode
+• Suitable for: Main control stations, operator workstations"""
+
+_NODE_DESC = """• Camera server for video streaming
+• WebRTC streaming capabilities
+• Raspberry Pi camera support
+• Headless operation support
+• Suitable for: Camera nodes, Raspberry Pi devices"""
+
+_BOTH_DESC = """• Full system installation
+• Both control and node capabilities
+• Complete development environment
+• Suitable for: Single-machine setups, development systems"""
+
+# pip and uv output lines that name a package being collected, already present or installed
+_PROGRESS_PACKAGE_PREFIXES = ('Collecting ', 'Requirement already satisfied: ', ' + ')
+
+# pip and uv output lines that mark the final install step
+_PROGRESS_FINAL_PREFIXES = ('Installing collected', 'Installed ', 'Audited ')
+
+# Distribution name at the start of a requirement
+_REQ_NAME_RE = re.compile(r'[A-Za-z0-9][A-Za-z0-9_.\-]*')
+
+
+def _normalize_name(name):
+    """Normalize a distribution name so pip's and uv's spellings compare equal"""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+_STACK_DISPLAY_NAMES = {
+    'control': 'Control Stack',
+    'node': 'Node Stack',
+    'both': 'Both Stacks (Complete)'
+}
+
+_CONTROL_COMPONENTS = """• Control Stack
+  - Camera management interface
+  - Real-time video processing
+  - Configuration tools
+  - Demo mode capabilities
+"""
+
+_NODE_COMPONENTS = """• Node Stack
+  - Camera server
+  - WebRTC streaming
+  - Raspberry Pi support
+  - Headless operation
+"""
+
+
+_DEFAULT_LICENSE = """GNU AFFERO GENERAL PUBLIC LICENSE
+Version 3, 19 November 2007
+
+Copyright (C) 2025 Automated Followspot System
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+[This is a summary. The full license text is available in the LICENSE file.]"""
+
+
+def _dumps(obj):
+    """Serialize a config dict to indented JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _loads(data):
+    """Parse JSON bytes into a config dict"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_COMPLETION_SUCCESS_TEXT = """✅ Installation completed successfully!
+
+Installed Components:
+{components}
+
+What's Next:
+• Launch the application using: python launcher.py
+• Configure cameras: python launcher.py --configure  
+• Try demo mode: python launcher.py --demo
+• Read the documentation: README.md
+
+The Automated Followspot System is now ready to use!"""
+
+_COMPLETION_FAILURE_TEXT = """❌ Installation failed!
+
+Please check the installation log above for error details.
+
+Troubleshooting:
+• Ensure you have a stable internet connection
+• Check that you have sufficient permissions
+• Verify Python 3.7+ is installed
+• Try running the installer as administrator (Windows) or with sudo (Linux/Mac)
+
+For help, visit: https://github.com/Stavro-Purdie/Automated-Followspot-System/issues"""
+
+
+@functools.lru_cache(maxsize=4)
+def _summary_text(stack_type, install_path, shortcuts, auto_start):
+    """Build the ready-to-install summary for a set of user choices"""
+    parts = [f"""The wizard is ready to begin installation.
+
+Installation Summary:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Installation Type: {_STACK_DISPLAY_NAMES.get(stack_type, 'Unknown')}
+Installation Directory: {install_path}
+Create Shortcuts: {'Yes' if shortcuts else 'No'}
+"""]
+    
+    if stack_type in ['node', 'both']:
+        parts.append(f"Auto-start Node: {'Yes' if auto_start else 'No'}\n")
+    
+    parts.append("""
+Components to Install:
+""")
+    
+    if stack_type in ['control', 'both']:
+        parts.append(_CONTROL_COMPONENTS)
+    
+    if stack_type in ['node', 'both']:
+        parts.append(_NODE_COMPONENTS)
+    
+    parts.append("""
+Dependencies will be automatically downloaded and installed.
+
+Click Install to begin the installation process.""")
+    
+    return "".join(parts)
+
 
 class InstallationWizard:
     """InstallShield-style installation wizard"""
@@ -30,9 +207,26 @@ class InstallationWizard:
         self.current_step = 0
         self.installation_complete = False
         self.installation_successful = False
+        self.log_queue = queue.Queue()
+        self._platform_cache = None
+        self._space_cache = {}
+        self._config_path = _ROOT / "config" / "launcher_config.json"
+        self.progress_total = 0
+        self.progress_done = 0
+        self._progress_names = set()
+        self._progress_seen = set()
+        self._progress_final = False
+        self._progress_shown = None
+        
+        # Background wheel prefetch, started once the license is accepted
+        self._prefetch_thread = None
+        self._prefetch_key = None
+        self._prefetch_cancel = None
+        self._prefetch_proc = None
+        self._prefetch_lock = threading.Lock()
         self.user_choices = {
             'stack_type': stack_type,
-            'install_path': str(Path(__file__).parent.absolute()),
+            'install_path': str(_HERE),
             'create_shortcuts': True,
             'add_to_path': False,
             'auto_start': False
@@ -49,7 +243,7 @@ class InstallationWizard:
         self.header_frame = ttk.Frame(self.main_frame)
         self.header_frame.pack(fill=tk.X, pady=(0, 20))
         
-        # Content frame (will be replaced for each step)
+        # Content frame (holds one prebuilt frame per step)
         self.content_frame = ttk.Frame(self.main_frame)
         self.content_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
         
@@ -60,17 +254,33 @@ class InstallationWizard:
         # Setup navigation
         self.setup_navigation()
         
-        # Define wizard steps
+        # Wizard steps: refresh hooks for steps with dynamic content, None for static ones
         self.steps = [
-            self.step_welcome,
-            self.step_stack_selection,
-            self.step_license,
+            None,  # Welcome
+            None,  # Stack selection
+            None,  # License agreement
             self.step_installation_options,
             self.step_ready_to_install,
             self.step_installation_progress,
             self.step_completion
         ]
         
+        # Per-step validators, indexed by step number
+        self._validators = [None, self._validate_stack, self._validate_license] + [None] * (len(self.steps) - 3)
+        
+        # Build every step's widgets once; show_step only swaps which one is packed
+        self._step_frames = [build() for build in (
+            self._build_step_welcome,
+            self._build_step_stack_selection,
+            self._build_step_license,
+            self._build_step_installation_options,
+            self._build_step_ready_to_install,
+            self._build_step_installation_progress,
+            self._build_step_completion
+        )]
+        self._shown_step = None
+        self._log_drain_started = False
+        
         # Start with first step
         self.show_step(0)
     
@@ -79,16 +289,16 @@ class InstallationWizard:
         self.style = ttk.Style()
         self.style.theme_use('clam')
         
-        # Custom styles for wizard
-        self.style.configure('Wizard.TLabel', font=('Arial', 10))
+        # Default fonts for plain labels and buttons, plus the header styles
+        self.style.configure('TLabel', font=('Arial', 10))
+        self.style.configure('TButton', font=('Arial', 10))
         self.style.configure('WizardTitle.TLabel', font=('Arial', 14, 'bold'))
         self.style.configure('WizardSubtitle.TLabel', font=('Arial', 11))
-        self.style.configure('WizardButton.TButton', font=('Arial', 10))
     
     def setup_navigation(self):
         """Setup navigation buttons"""
         # Progress indicator
-        self.progress_label = ttk.Label(self.nav_frame, text="Step 1 of 7", style='Wizard.TLabel')
+        self.progress_label = ttk.Label(self.nav_frame, text="Step 1 of 7")
         self.progress_label.pack(side=tk.LEFT)
         
         # Buttons
@@ -96,29 +306,37 @@ class InstallationWizard:
         button_frame.pack(side=tk.RIGHT)
         
         self.back_button = ttk.Button(button_frame, text="< Back", 
-                                     command=self.go_back, style='WizardButton.TButton')
+                                     command=self.go_back)
         self.back_button.pack(side=tk.LEFT, padx=(0, 10))
         
         self.next_button = ttk.Button(button_frame, text="Next >", 
-                                     command=self.go_next, style='WizardButton.TButton')
+                                     command=self.go_next)
         self.next_button.pack(side=tk.LEFT, padx=(0, 10))
         
         self.cancel_button = ttk.Button(button_frame, text="Cancel", 
-                                       command=self.cancel_installation, style='WizardButton.TButton')
+                                       command=self.cancel_installation)
         self.cancel_button.pack(side=tk.LEFT)
     
-    def clear_content(self):
-        """Clear the content frame"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-    
     def show_step(self, step_num):
         """Show a specific step"""
         if 0 <= step_num < len(self.steps):
+            if self._shown_step is not None:
+                header, content = self._step_frames[self._shown_step]
+                header.pack_forget()
+                content.pack_forget()
+            
             self.current_step = step_num
             self.update_progress()
-            self.clear_content()
-            self.steps[step_num]()
+            
+            # Refresh the step's dynamic content, then show its prebuilt frames
+            refresh = self.steps[step_num]
+            if refresh is not None:
+                refresh()
+            header, content = self._step_frames[step_num]
+            header.pack(fill=tk.X)
+            content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+            self._shown_step = step_num
+            
             self.update_navigation()
     
     def update_progress(self):
@@ -127,8 +345,10 @@ class InstallationWizard:
     
     def update_navigation(self):
         """Update navigation button states"""
+        installing = self.current_step == len(self.steps) - 2  # Installation progress step
+        
         # Back button
-        if self.current_step == 0:
+        if self.current_step == 0 or installing:
             self.back_button.config(state=tk.DISABLED)
         else:
             self.back_button.config(state=tk.NORMAL)
@@ -139,8 +359,10 @@ class InstallationWizard:
                 self.next_button.config(text="Finish", command=self.finish_installation)
             else:
                 self.next_button.config(state=tk.DISABLED)
-        elif self.current_step == len(self.steps) - 2:  # Installation step
-            self.next_button.config(text="Install", command=self.start_installation)
+        elif installing:
+            self.next_button.config(state=tk.DISABLED)
+        elif self.current_step == len(self.steps) - 3:  # Ready to install step
+            self.next_button.config(text="Install", command=self.start_installation, state=tk.NORMAL)
         else:
             self.next_button.config(text="Next >", command=self.go_next, state=tk.NORMAL)
         
@@ -155,19 +377,23 @@ class InstallationWizard:
     
     def go_next(self):
         """Go to next step"""
-        if self.validate_current_step():
-            if self.current_step < len(self.steps) - 1:
-                self.show_step(self.current_step + 1)
+        validator = self._validators[self.current_step]
+        if validator and not validator():
+            return
+        if self.current_step < len(self.steps) - 1:
+            self.show_step(self.current_step + 1)
     
-    def validate_current_step(self):
-        """Validate current step before proceeding"""
-        if self.current_step == 1 and not self.user_choices['stack_type']:
+    def _validate_stack(self):
+        """Validate that a stack type has been selected"""
+        if not self.user_choices['stack_type']:
+            from tkinter import messagebox
             messagebox.showerror("Selection Required", "Please select a stack type to install.")
             return False
         return True
     
     def cancel_installation(self):
         """Cancel the installation"""
+        from tkinter import messagebox
         if messagebox.askyesno("Cancel Installation", 
                               "Are you sure you want to cancel the installation?"):
             self.root.quit()
@@ -177,48 +403,37 @@ class InstallationWizard:
         self.root.quit()
     
     # Wizard Steps
-    def step_welcome(self):
-        """Welcome step"""
-        # Header
-        header_label = ttk.Label(self.header_frame, 
-                                text="Welcome to the Automated Followspot System Setup Wizard",
-                                style='WizardTitle.TLabel')
-        header_label.pack()
+    def _build_step_frames(self, title, subtitle=None):
+        """Create the header and content frames for one step"""
+        header = ttk.Frame(self.header_frame)
+        title_label = ttk.Label(header, text=title, style='WizardTitle.TLabel')
+        title_label.pack()
+        
+        subtitle_label = None
+        if subtitle is not None:
+            subtitle_label = ttk.Label(header, text=subtitle, style='WizardSubtitle.TLabel')
+            subtitle_label.pack()
+        
+        content = ttk.Frame(self.content_frame)
+        return header, content, title_label, subtitle_label
+    
+    def _build_step_welcome(self):
+        """Build the welcome step"""
+        header, content, _, _ = self._build_step_frames(
+            "Welcome to the Automated Followspot System Setup Wizard")
         
-        # Content
-        welcome_text = """This wizard will guide you through the installation of the Automated Followspot System.
-
-The Automated Followspot System is a multi-camera IR beacon tracking solution designed for live performance applications.
-
-Before you begin:
-• Ensure you have Python 3.7 or later installed
-• Make sure you have an active internet connection for downloading dependencies
-• Close any other Python applications that might interfere
-
-Click Next to continue with the installation."""
-
-        text_widget = tk.Text(self.content_frame, wrap=tk.WORD, height=15, width=60,
+        text_widget = tk.Text(content, wrap=tk.WORD, height=15, width=60,
                              font=('Arial', 10), relief=tk.FLAT, bg=self.root.cget('bg'))
-        text_widget.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        text_widget.insert(tk.END, welcome_text)
+        text_widget.pack(fill=tk.BOTH, expand=True)
+        text_widget.insert(tk.END, _WELCOME_TEXT)
         text_widget.config(state=tk.DISABLED)
-    
-    def step_stack_selection(self):
-        """Stack selection step"""
-        # Header
-        header_label = ttk.Label(self.header_frame, 
-                                text="Select Installation Type",
-                                style='WizardTitle.TLabel')
-        header_label.pack()
         
-        subtitle_label = ttk.Label(self.header_frame, 
-                                  text="Choose which stack you want to install",
-                                  style='WizardSubtitle.TLabel')
-        subtitle_label.pack()
-        
-        # Content
-        selection_frame = ttk.Frame(self.content_frame)
-        selection_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        return header, content
+    
+    def _build_step_stack_selection(self):
+        """Build the stack selection step"""
+        header, selection_frame, _, _ = self._build_step_frames(
+            "Select Installation Type", "Choose which stack you want to install")
         
         self.stack_var = tk.StringVar(value=self.user_choices['stack_type'] or "")
         
@@ -230,13 +445,7 @@ Click Next to continue with the installation."""
                        variable=self.stack_var, value="control",
                        command=self.update_stack_choice).pack(anchor=tk.W)
         
-        control_desc = """• Camera management and tracking interface
-• Real-time video processing and IR beacon detection
-• Multi-camera composite display
-• Configuration tools and demo mode
-• Suitable for: Main control stations, operator workstations"""
-        
-        ttk.Label(control_frame, text=control_desc, style='Wizard.TLabel').pack(anchor=tk.W, pady=(5, 0))
+        ttk.Label(control_frame, text=_CONTROL_DESC).pack(anchor=tk.W, pady=(5, 0))
         
         # Node Stack option
         node_frame = ttk.LabelFrame(selection_frame, text="Node Stack", padding=15)
@@ -246,13 +455,7 @@ Click Next to continue with the installation."""
                        variable=self.stack_var, value="node",
                        command=self.update_stack_choice).pack(anchor=tk.W)
         
-        node_desc = """• Camera server for video streaming
-• WebRTC streaming capabilities
-• Raspberry Pi camera support
-• Headless operation support
-• Suitable for: Camera nodes, Raspberry Pi devices"""
-        
-        ttk.Label(node_frame, text=node_desc, style='Wizard.TLabel').pack(anchor=tk.W, pady=(5, 0))
+        ttk.Label(node_frame, text=_NODE_DESC).pack(anchor=tk.W, pady=(5, 0))
         
         # Both option
         both_frame = ttk.LabelFrame(selection_frame, text="Complete Installation", padding=15)
@@ -262,33 +465,22 @@ Click Next to continue with the installation."""
                        variable=self.stack_var, value="both",
                        command=self.update_stack_choice).pack(anchor=tk.W)
         
-        both_desc = """• Full system installation
-• Both control and node capabilities
-• Complete development environment
-• Suitable for: Single-machine setups, development systems"""
+        ttk.Label(both_frame, text=_BOTH_DESC).pack(anchor=tk.W, pady=(5, 0))
         
-        ttk.Label(both_frame, text=both_desc, style='Wizard.TLabel').pack(anchor=tk.W, pady=(5, 0))
+        return header, selection_frame
     
     def update_stack_choice(self):
         """Update stack choice from radio button"""
         self.user_choices['stack_type'] = self.stack_var.get()
-    
-    def step_license(self):
-        """License agreement step"""
-        # Header
-        header_label = ttk.Label(self.header_frame, 
-                                text="License Agreement",
-                                style='WizardTitle.TLabel')
-        header_label.pack()
-        
-        subtitle_label = ttk.Label(self.header_frame, 
-                                  text="Please read the following license agreement",
-                                  style='WizardSubtitle.TLabel')
-        subtitle_label.pack()
         
-        # Content
-        license_frame = ttk.Frame(self.content_frame)
-        license_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        # Stack changed after going back from the license step
+        if self.license_accepted.get():
+            self._start_prefetch()
+    
+    def _build_step_license(self):
+        """Build the license agreement step"""
+        header, license_frame, _, _ = self._build_step_frames(
+            "License Agreement", "Please read the following license agreement")
         
         # License text
         license_text = scrolledtext.ScrolledText(license_frame, height=15, width=60,
@@ -296,8 +488,7 @@ Click Next to continue with the installation."""
         license_text.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
         # Read license from file or use default
-        license_content = self.get_license_text()
-        license_text.insert(tk.END, license_content)
+        license_text.insert(tk.END, self._license_text)
         license_text.config(state=tk.DISABLED)
         
         # Acceptance checkbox
@@ -309,79 +500,76 @@ Click Next to continue with the installation."""
                        variable=self.license_accepted,
                        command=self.update_license_acceptance).pack(anchor=tk.W)
         
-        # Override next button validation
-        self.original_validate = self.validate_current_step
-        self.validate_current_step = self.validate_license_step
+        return header, license_frame
     
-    def get_license_text(self):
-        """Get license text"""
-        license_file = Path(__file__).parent / "LICENSE"
+    @functools.cached_property
+    def _license_text(self):
+        """License text, read from the repository LICENSE file on first use"""
+        license_file = _ROOT / "LICENSE"
         if license_file.exists():
             try:
-                with open(license_file, 'r') as f:
-                    return f.read()
-            except:
+                return license_file.read_text()
+            except Exception:
                 pass
         
-        return """GNU AFFERO GENERAL PUBLIC LICENSE
-Version 3, 19 November 2007
-
-Copyright (C) 2025 Automated Followspot System
-
-This program is free software: you can redistribute it and/or modify
-it under the terms of the GNU Affero General Public License as published
-by the Free Software Foundation, either version 3 of the License, or
-(at your option) any later version.
-
-This program is distributed in the hope that it will be useful,
-but WITHOUT ANY WARRANTY; without even the implied warranty of
-MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
-GNU Affero General Public License for more details.
-
-You should have received a copy of the GNU Affero General Public License
-along with this program. If not, see <https://www.gnu.org/licenses/>.
-
-[This is a summary. The full license text is available in the LICENSE file.]"""
+        return _DEFAULT_LICENSE
     
     def update_license_acceptance(self):
         """Update license acceptance"""
         if self.license_accepted.get():
             self.next_button.config(state=tk.NORMAL)
+            
+            # Download wheels while the user fills in the remaining steps
+            self._start_prefetch()
         else:
             self.next_button.config(state=tk.DISABLED)
     
-    def validate_license_step(self):
+    def _start_prefetch(self):
+        """Prefetch wheels for the selected stacks and path, replacing any prefetch for an older selection"""
+        key = (tuple(self.get_stacks_to_install()), self.get_wheelhouse_dir())
+        if key == self._prefetch_key:
+            return
+        
+        self._cancel_prefetch()
+        self._prefetch_key = key
+        self._prefetch_cancel = threading.Event()
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch_wheels, args=(*key, self._prefetch_cancel), daemon=True)
+        self._prefetch_thread.start()
+    
+    def _cancel_prefetch(self):
+        """Stop a running prefetch so only one ever writes to the wheelhouse"""
+        if self._prefetch_thread is None:
+            return
+        
+        self._prefetch_cancel.set()
+        with self._prefetch_lock:
+            process = self._prefetch_proc
+        if process is not None and process.poll() is None:
+            process.terminate()
+        self._prefetch_thread.join(timeout=5)
+        self._prefetch_thread = None
+        self._prefetch_key = None
+    
+    def _validate_license(self):
         """Validate license acceptance"""
         if not self.license_accepted.get():
+            from tkinter import messagebox
             messagebox.showerror("License Agreement", 
                                "You must accept the license agreement to continue.")
             return False
-        # Restore original validation for other steps
-        self.validate_current_step = self.original_validate
         return True
     
-    def step_installation_options(self):
-        """Installation options step"""
-        # Header
-        header_label = ttk.Label(self.header_frame, 
-                                text="Installation Options",
-                                style='WizardTitle.TLabel')
-        header_label.pack()
-        
-        subtitle_label = ttk.Label(self.header_frame, 
-                                  text="Configure installation settings",
-                                  style='WizardSubtitle.TLabel')
-        subtitle_label.pack()
-        
-        # Content
-        options_frame = ttk.Frame(self.content_frame)
-        options_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+    def _build_step_installation_options(self):
+        """Build the installation options step"""
+        header, options_frame, _, _ = self._build_step_frames(
+            "Installation Options", "Configure installation settings")
         
         # Installation path
         path_frame = ttk.LabelFrame(options_frame, text="Installation Directory", padding=10)
         path_frame.pack(fill=tk.X, pady=(0, 15))
         
-        ttk.Label(path_frame, text="Install to:", style='Wizard.TLabel').pack(anchor=tk.W)
+        ttk.Label(path_frame, text="Install to:").pack(anchor=tk.W)
         
         path_entry_frame = ttk.Frame(path_frame)
         path_entry_frame.pack(fill=tk.X, pady=(5, 0))
@@ -401,25 +589,37 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
         ttk.Checkbutton(options_label_frame, text="Create desktop shortcuts",
                        variable=self.shortcuts_var).pack(anchor=tk.W, pady=(0, 5))
         
-        if self.user_choices['stack_type'] == 'node' or self.user_choices['stack_type'] == 'both':
-            self.autostart_var = tk.BooleanVar(value=self.user_choices['auto_start'])
-            ttk.Checkbutton(options_label_frame, text="Start node server automatically at boot (Linux/Pi only)",
-                           variable=self.autostart_var).pack(anchor=tk.W, pady=(0, 5))
+        # Only shown for stacks that include the node server
+        self.autostart_var = tk.BooleanVar(value=self.user_choices['auto_start'])
+        self.autostart_check = ttk.Checkbutton(options_label_frame,
+                                               text="Start node server automatically at boot (Linux/Pi only)",
+                                               variable=self.autostart_var)
         
         # System requirements
         req_frame = ttk.LabelFrame(options_frame, text="System Requirements", padding=10)
         req_frame.pack(fill=tk.X)
         
+        self.req_label = ttk.Label(req_frame)
+        self.req_label.pack(anchor=tk.W)
+        
+        return header, options_frame
+    
+    def step_installation_options(self):
+        """Installation options step"""
+        if self.user_choices['stack_type'] in ('node', 'both'):
+            self.autostart_check.pack(anchor=tk.W, pady=(0, 5))
+        else:
+            self.autostart_check.pack_forget()
+        
         req_text = f"""Installation Type: {self.get_stack_display_name()}
 Python Version: {sys.version.split()[0]}
 Available Space: {self.get_available_space()}
 Internet Connection: Required for dependency download"""
         
-        ttk.Label(req_frame, text=req_text, style='Wizard.TLabel').pack(anchor=tk.W)
+        self.req_label.config(text=req_text)
     
     def browse_install_path(self):
         """Browse for installation path"""
-        from tkinter import filedialog
         path = filedialog.askdirectory(initialdir=self.path_var.get())
         if path:
             self.path_var.set(path)
@@ -427,115 +627,78 @@ Internet Connection: Required for dependency download"""
     
     def get_stack_display_name(self):
         """Get display name for selected stack"""
-        stack_map = {
-            'control': 'Control Stack',
-            'node': 'Node Stack', 
-            'both': 'Both Stacks (Complete)'
-        }
-        return stack_map.get(self.user_choices['stack_type'], 'Unknown')
+        return _STACK_DISPLAY_NAMES.get(self.user_choices['stack_type'], 'Unknown')
     
     def get_available_space(self):
         """Get available disk space (simplified)"""
+        install_path = self.user_choices['install_path']
+        if install_path in self._space_cache:
+            return self._space_cache[install_path]
+        
         try:
-            import shutil
-            total, used, free = shutil.disk_usage(self.user_choices['install_path'])
-            return f"{free // (1024**3)} GB available"
+            total, used, free = shutil.disk_usage(install_path)
+            result = f"{free // (1024**3)} GB available"
         except:
-            return "Unknown"
-    
-    def step_ready_to_install(self):
-        """Ready to install step"""
-        # Header
-        header_label = ttk.Label(self.header_frame, 
-                                text="Ready to Install",
-                                style='WizardTitle.TLabel')
-        header_label.pack()
-        
-        subtitle_label = ttk.Label(self.header_frame, 
-                                  text="Review your installation settings",
-                                  style='WizardSubtitle.TLabel')
-        subtitle_label.pack()
+            result = "Unknown"
         
-        # Content
-        summary_frame = ttk.Frame(self.content_frame)
-        summary_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        summary_text = f"""The wizard is ready to begin installation.
-
-Installation Summary:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Installation Type: {self.get_stack_display_name()}
-Installation Directory: {self.user_choices['install_path']}
-Create Shortcuts: {'Yes' if self.user_choices.get('create_shortcuts', False) else 'No'}
-"""
-        
-        if self.user_choices['stack_type'] in ['node', 'both']:
-            summary_text += f"Auto-start Node: {'Yes' if self.user_choices.get('auto_start', False) else 'No'}\n"
-        
-        summary_text += f"""
-Components to Install:
-"""
-        
-        if self.user_choices['stack_type'] in ['control', 'both']:
-            summary_text += """• Control Stack
-  - Camera management interface
-  - Real-time video processing
-  - Configuration tools
-  - Demo mode capabilities
-"""
-        
-        if self.user_choices['stack_type'] in ['node', 'both']:
-            summary_text += """• Node Stack
-  - Camera server
-  - WebRTC streaming
-  - Raspberry Pi support
-  - Headless operation
-"""
-        
-        summary_text += """
-Dependencies will be automatically downloaded and installed.
-
-Click Install to begin the installation process."""
-        
-        text_widget = tk.Text(summary_frame, wrap=tk.WORD, height=15, width=60,
-                             font=('Arial', 10), relief=tk.SUNKEN, bg='white')
-        text_widget.pack(fill=tk.BOTH, expand=True)
-        text_widget.insert(tk.END, summary_text)
-        text_widget.config(state=tk.DISABLED)
+        self._space_cache[install_path] = result
+        return result
     
-    def step_installation_progress(self):
-        """Installation progress step"""
-        # Header
-        header_label = ttk.Label(self.header_frame, 
-                                text="Installing Automated Followspot System",
-                                style='WizardTitle.TLabel')
-        header_label.pack()
+    def _build_step_ready_to_install(self):
+        """Build the ready to install step"""
+        header, summary_frame, _, _ = self._build_step_frames(
+            "Ready to Install", "Review your installation settings")
         
-        self.status_label = ttk.Label(self.header_frame, 
-                                     text="Preparing installation...",
-                                     style='WizardSubtitle.TLabel')
-        self.status_label.pack()
+        self.summary_text_widget = tk.Text(summary_frame, wrap=tk.WORD, height=15, width=60,
+                                           font=('Arial', 10), relief=tk.SUNKEN, bg='white')
+        self.summary_text_widget.pack(fill=tk.BOTH, expand=True)
         
-        # Content
-        progress_frame = ttk.Frame(self.content_frame)
-        progress_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        return header, summary_frame
+    
+    def step_ready_to_install(self):
+        """Ready to install step"""
+        # The install path is final once the options step is left
+        self.user_choices['install_path'] = self.path_var.get()
+        self._start_prefetch()
+        
+        summary_text = _summary_text(
+            self.user_choices['stack_type'],
+            self.user_choices['install_path'],
+            self.user_choices.get('create_shortcuts', False),
+            self.user_choices.get('auto_start', False)
+        )
+        
+        self.summary_text_widget.config(state=tk.NORMAL)
+        self.summary_text_widget.delete('1.0', tk.END)
+        self.summary_text_widget.insert(tk.END, summary_text)
+        self.summary_text_widget.config(state=tk.DISABLED)
+    
+    def _build_step_installation_progress(self):
+        """Build the installation progress step"""
+        header, progress_frame, _, self.status_label = self._build_step_frames(
+            "Installing Automated Followspot System", "Preparing installation...")
         
         # Progress bar
-        self.progress_bar = ttk.Progressbar(progress_frame, mode='indeterminate')
+        self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate')
         self.progress_bar.pack(fill=tk.X, pady=(0, 15))
         
         # Installation log
-        log_label = ttk.Label(progress_frame, text="Installation Log:", style='Wizard.TLabel')
+        log_label = ttk.Label(progress_frame, text="Installation Log:")
         log_label.pack(anchor=tk.W)
         
         self.log_text = scrolledtext.ScrolledText(progress_frame, height=15, width=60,
                                                  font=('Consolas', 9))
         self.log_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
         
+        return header, progress_frame
+    
+    def step_installation_progress(self):
+        """Installation progress step"""
+        if not self._log_drain_started:
+            self._log_drain_started = True
+            self.root.after(50, self._drain_log)
+        
         # Disable navigation during installation
-        self.back_button.config(state=tk.DISABLED)
-        self.next_button.config(state=tk.DISABLED)
         self.cancel_button.config(state=tk.DISABLED)
     
     def start_installation(self):
@@ -543,14 +706,12 @@ Click Install to begin the installation process."""
         # Update user choices from UI
         self.user_choices['install_path'] = self.path_var.get()
         self.user_choices['create_shortcuts'] = self.shortcuts_var.get()
-        if hasattr(self, 'autostart_var'):
-            self.user_choices['auto_start'] = self.autostart_var.get()
+        self.user_choices['auto_start'] = self.autostart_var.get()
         
         # Go to installation progress step
         self.show_step(len(self.steps) - 2)  # Installation progress step
         
         # Start installation in background thread
-        self.progress_bar.start()
         threading.Thread(target=self.run_installation, daemon=True).start()
     
     def run_installation(self):
@@ -559,20 +720,21 @@ Click Install to begin the installation process."""
             self.log("Starting installation...")
             self.update_status("Installing dependencies...")
             
-            stacks_to_install = []
-            if self.user_choices['stack_type'] == 'both':
-                stacks_to_install = ['control', 'node']
-            else:
-                stacks_to_install = [self.user_choices['stack_type']]
+            stacks_to_install = self.get_stacks_to_install()
             
-            success = True
-            for stack in stacks_to_install:
-                self.log(f"\n=== Installing {stack.title()} Stack ===")
-                self.update_status(f"Installing {stack.title()} Stack...")
-                
-                if not self.install_stack_dependencies(stack):
-                    success = False
-                    break
+            stack_titles = " + ".join(stack.title() for stack in stacks_to_install)
+            self.log(f"\n=== Installing {stack_titles} Stack ===")
+            self.update_status(f"Installing {stack_titles} Stack...")
+            
+            # Keep a wizard-local wheel cache so re-runs skip the downloads
+            pip_env = {
+                **os.environ,
+                "PIP_CACHE_DIR": self.get_pip_cache_dir(),
+                "UV_CACHE_DIR": self.get_pip_cache_dir(),
+                "PIP_DISABLE_PIP_VERSION_CHECK": "1"
+            }
+            
+            success = self.install_stack_dependencies(stacks_to_install, env=pip_env)
             
             if success:
                 self.log("\n=== Updating configuration ===")
@@ -606,89 +768,229 @@ Click Install to begin the installation process."""
     
     def log(self, message):
         """Add message to installation log"""
-        self.root.after(0, lambda: self._log_message(message))
+        self.log_queue.put(f"{message}\n")
     
-    def _log_message(self, message):
-        """Internal log message method (runs on main thread)"""
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+    def stream_output(self, process, track_progress=False):
+        """Forward subprocess output to the log in large chunks rather than line by line"""
+        if not process.stdout:
+            return
+        
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        pending_line = ""
+        while True:
+            chunk = process.stdout.read1(65536)
+            if not chunk:
+                break
+            text = decoder.decode(chunk)
+            if text:
+                text = text.replace('\r\n', '\n')
+                self.log_queue.put(text)
+                
+                if track_progress:
+                    lines = (pending_line + text).split('\n')
+                    pending_line = lines.pop()
+                    self._track_progress(lines)
+        
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            self.log_queue.put(tail)
+    
+    def _track_progress(self, lines):
+        """Advance progress for listed requirements only; transitive dependencies don't count"""
+        for line in lines:
+            if line.startswith(_PROGRESS_FINAL_PREFIXES):
+                self._progress_final = True
+                continue
+            for prefix in _PROGRESS_PACKAGE_PREFIXES:
+                if line.startswith(prefix):
+                    match = _REQ_NAME_RE.match(line, len(prefix))
+                    if match:
+                        name = _normalize_name(match.group(0))
+                        if name in self._progress_names:
+                            self._progress_seen.add(name)
+                    break
+        
+        self.progress_done = len(self._progress_seen) + self._progress_final
+    
+    def _reset_progress(self):
+        """Forget packages seen by a failed install run before retrying"""
+        self._progress_seen.clear()
+        self._progress_final = False
+        self.progress_done = 0
+    
+    def _drain_log(self):
+        """Flush queued log messages into the log widget in one insert (runs on main thread)"""
+        if not self.log_text.winfo_exists():
+            return
+        
+        messages = []
+        try:
+            while len(messages) < 500:
+                messages.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if messages:
+            self.log_text.insert(tk.END, "".join(messages))
+            
+            # Bound the scrollback so long pip runs don't slow the widget down
+            if int(self.log_text.index('end-1c').split('.')[0]) > 2500:
+                self.log_text.delete('1.0', 'end-2000l')
+            
+            self.log_text.see(tk.END)
+        
+        # Only touch the progress bar when the worker has reported progress
+        progress = (self.progress_total, min(self.progress_done, self.progress_total))
+        if progress != self._progress_shown:
+            self.progress_bar.config(maximum=max(progress[0], 1), value=progress[1])
+            self._progress_shown = progress
+        
+        self.root.after(50, self._drain_log)
     
     def update_status(self, status):
         """Update status label"""
         self.root.after(0, lambda: self.status_label.config(text=status))
     
-    def install_stack_dependencies(self, stack_type):
-        """Install dependencies for a specific stack"""
-        requirements_file = Path(__file__).parent / stack_type / "requirements.txt"
-        
-        if not requirements_file.exists():
-            self.log(f"❌ Requirements file not found: {requirements_file}")
-            return False
+    def get_pip_cache_dir(self):
+        """Get the wheel cache directory used by the installer's pip runs"""
+        return str(Path(self.user_choices['install_path']) / ".pip-cache")
+    
+    def get_wheelhouse_dir(self):
+        """Get the directory the wheel prefetch downloads into (kept apart from pip's own cache)"""
+        return Path(self.user_choices['install_path']) / ".wheelhouse"
+    
+    def get_stacks_to_install(self):
+        """Get the stack directories for the selected installation type"""
+        if self.user_choices['stack_type'] == 'both':
+            return ['control', 'node']
+        return [self.user_choices['stack_type']]
+    
+    def _prefetch_wheels(self, stack_types, wheel_dir, cancelled):
+        """Download the stacks' wheels into the wheelhouse (runs in background)"""
+        cmd = [sys.executable, "-m", "pip", "download", "--quiet", "--disable-pip-version-check",
+               "--no-input", "--prefer-binary", "-d", str(wheel_dir)]
+        for stack in stack_types:
+            requirements_file = _ROOT / stack / "requirements.txt"
+            if requirements_file.exists():
+                cmd += ["-r", str(requirements_file)]
         
-        self.log(f"📦 Installing {stack_type} dependencies from {requirements_file}")
+        try:
+            with self._prefetch_lock:
+                if cancelled.is_set():
+                    return
+                self._prefetch_proc = subprocess.Popen(
+                    cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if self._prefetch_proc.wait() == 0 and not cancelled.is_set():
+                self.log(f"📦 Prefetched dependency wheels into {wheel_dir}")
+        except Exception as e:
+            self.log(f"⚠️  Wheel prefetch skipped: {e}")
+    
+    def install_stack_dependencies(self, stack_types, env=None):
+        """Install dependencies for the given stacks in a single pip run"""
+        pip_flags = ["--disable-pip-version-check", "--no-input", "--no-color", "--progress-bar", "off"]
+        stack_names = " and ".join(stack_types)
+        requirements_files = [_ROOT / stack / "requirements.txt"
+                              for stack in stack_types]
+        
+        for requirements_file in requirements_files:
+            if not requirements_file.exists():
+                self.log(f"❌ Requirements file not found: {requirements_file}")
+                return False
+            self.log(f"📦 Installing {requirements_file.parent.name} dependencies from {requirements_file}")
+            
+            # One step per listed requirement plus the final install step
+            with open(requirements_file, 'r') as f:
+                for line in f:
+                    match = _REQ_NAME_RE.match(line.strip())
+                    if match:
+                        self._progress_names.add(_normalize_name(match.group(0)))
+        self.progress_total = len(self._progress_names) + 1
         
         try:
-            # Upgrade pip first
-            cmd = [sys.executable, "-m", "pip", "install", "--upgrade", "pip"]
-            self.log(f"Running: {' '.join(cmd)}")
+            # Give the prefetch for this selection a chance to finish, then install from its wheels
+            find_links = []
+            wheelhouse = self.get_wheelhouse_dir()
+            prefetch_thread = self._prefetch_thread
+            if prefetch_thread is not None and self._prefetch_key == (tuple(stack_types), wheelhouse):
+                prefetch_thread.join(timeout=60)
+                if prefetch_thread.is_alive():
+                    self.log("⚠️  Wheel prefetch still running after 60s, installing without it")
+                    self._cancel_prefetch()
+                elif wheelhouse.is_dir():
+                    find_links = ["--find-links", str(wheelhouse)]
             
-            process = subprocess.Popen(
-                cmd, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.STDOUT,
-                text=True,
-                universal_newlines=True
-            )
+            uv = shutil.which("uv")
+            if uv:
+                # uv resolves and installs without pip's interpreter startup cost
+                cmd = [uv, "pip", "install", "--python", sys.executable, "--no-progress", *find_links]
+                for requirements_file in requirements_files:
+                    cmd += ["-r", str(requirements_file)]
+                self.log(f"Running: {' '.join(cmd)}")
+                
+                process = subprocess.Popen(
+                    cmd, 
+                    stdout=subprocess.PIPE, 
+                    stderr=subprocess.STDOUT,
+                    env=env
+                )
+                
+                self.stream_output(process, track_progress=True)
+                process.wait()
+                
+                if process.returncode == 0:
+                    self.log(f"✅ {stack_names.title()} dependencies installed successfully")
+                    return True
+                
+                self.log(f"⚠️  uv install failed (exit code: {process.returncode}), falling back to pip")
+                self._reset_progress()
             
-            if process.stdout:
-                for line in process.stdout:
-                    self.log(line.strip())
+            # Upgrade pip once, not once per stack; its output isn't worth streaming
+            cmd = [sys.executable, "-m", "pip", "install", "--upgrade", "pip", "--quiet", *pip_flags]
+            self.log(f"Running: {' '.join(cmd)}")
             
-            process.wait()
+            result = subprocess.run(cmd, capture_output=True, text=True, env=env)
             
-            if process.returncode != 0:
-                self.log(f"❌ Failed to upgrade pip (exit code: {process.returncode})")
+            if result.returncode != 0:
+                self.log(result.stdout + result.stderr)
+                self.log(f"❌ Failed to upgrade pip (exit code: {result.returncode})")
                 return False
+            self.log("✅ pip is up to date")
             
-            # Install requirements
-            cmd = [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)]
+            # Install all requirements files in one resolver run
+            cmd = [sys.executable, "-m", "pip", "install", *pip_flags, *find_links, "--prefer-binary"]
+            for requirements_file in requirements_files:
+                cmd += ["-r", str(requirements_file)]
             self.log(f"Running: {' '.join(cmd)}")
             
             process = subprocess.Popen(
                 cmd, 
                 stdout=subprocess.PIPE, 
                 stderr=subprocess.STDOUT,
-                text=True,
-                universal_newlines=True
+                env=env
             )
             
-            if process.stdout:
-                for line in process.stdout:
-                    self.log(line.strip())
-            
+            self.stream_output(process, track_progress=True)
             process.wait()
             
             if process.returncode == 0:
-                self.log(f"✅ {stack_type.title()} dependencies installed successfully")
+                self.log(f"✅ {stack_names.title()} dependencies installed successfully")
                 return True
             else:
-                self.log(f"❌ Failed to install {stack_type} dependencies (exit code: {process.returncode})")
+                self.log(f"❌ Failed to install {stack_names} dependencies (exit code: {process.returncode})")
                 return False
                 
         except Exception as e:
-            self.log(f"❌ Error installing {stack_type} dependencies: {e}")
+            self.log(f"❌ Error installing {stack_names} dependencies: {e}")
             return False
     
     def update_launcher_config(self):
         """Update launcher configuration"""
         try:
-            config_file = Path(__file__).parent.parent / "config" / "launcher_config.json"
+            config_file = self._config_path
             
             # Load existing config or create new
             if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
+                config = _loads(config_file.read_bytes())
             else:
                 config = {
                     "system_info": {},
@@ -718,12 +1020,14 @@ Click Install to begin the installation process."""
                 }
             
             # Update system info
-            import platform
+            if self._platform_cache is None:
+                self._platform_cache = platform.platform()
             config["system_info"] = {
                 "version": "1.0.0",
                 "last_updated": datetime.now().isoformat(),
-                "os_info": platform.platform(),
-                "installation_path": self.user_choices['install_path']
+                "os_info": self._platform_cache,
+                "installation_path": self.user_choices['install_path'],
+                "pip_cache_dir": self.get_pip_cache_dir()
             }
             
             # Update installation status
@@ -748,8 +1052,16 @@ Click Install to begin the installation process."""
                     config["installations"][stack]["cron_enabled"] = self.user_choices.get('auto_start', False)
             
             # Save config
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Write to a temp file in one call, then swap it in atomically
+            data = _dumps(config)
+            tmp_file = config_file.with_suffix('.json.tmp')
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, config_file)
             
             self.log("✅ Configuration updated successfully")
             
@@ -776,12 +1088,14 @@ Click Install to begin the installation process."""
     
     def installation_finished(self):
         """Called when installation is complete"""
-        self.progress_bar.stop()
-        
         if self.installation_successful:
+            self.progress_done = self.progress_total
             self.update_status("Installation completed successfully!")
+            self._completion_text = _COMPLETION_SUCCESS_TEXT.format(
+                components=self._installed_components_text)
         else:
             self.update_status("Installation failed!")
+            self._completion_text = _COMPLETION_FAILURE_TEXT
         
         # Enable navigation to completion step
         self.next_button.config(state=tk.NORMAL, text="Next >")
@@ -790,77 +1104,52 @@ Click Install to begin the installation process."""
         # Move to completion step
         self.show_step(len(self.steps) - 1)
     
-    def step_completion(self):
-        """Completion step"""
-        # Header
-        if self.installation_successful:
-            header_label = ttk.Label(self.header_frame, 
-                                    text="Installation Complete",
-                                    style='WizardTitle.TLabel')
-            subtitle_text = "The Automated Followspot System has been successfully installed"
-        else:
-            header_label = ttk.Label(self.header_frame, 
-                                    text="Installation Failed",
-                                    style='WizardTitle.TLabel')
-            subtitle_text = "The installation encountered errors"
+    def _build_step_completion(self):
+        """Build the completion step"""
+        header, completion_frame, self.completion_title, self.completion_subtitle = \
+            self._build_step_frames("", "")
+        
+        # Launch buttons, only shown after a successful install
+        self.completion_buttons = ttk.Frame(completion_frame)
         
-        header_label.pack()
+        ttk.Button(self.completion_buttons, text="Launch Application Now", 
+                  command=self.launch_application).pack(side=tk.LEFT)
         
-        subtitle_label = ttk.Label(self.header_frame, 
-                                  text=subtitle_text,
-                                  style='WizardSubtitle.TLabel')
-        subtitle_label.pack()
+        ttk.Button(self.completion_buttons, text="Launch and Exit", 
+                  command=self.launch_and_exit).pack(side=tk.LEFT, padx=(10, 0))
         
-        # Content
-        completion_frame = ttk.Frame(self.content_frame)
-        completion_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        ttk.Button(self.completion_buttons, text="Open Documentation", 
+                  command=self.open_documentation).pack(side=tk.LEFT, padx=(10, 0))
         
+        self.completion_text_widget = tk.Text(completion_frame, wrap=tk.WORD, height=12, width=60,
+                                              font=('Arial', 10), relief=tk.FLAT, bg=self.root.cget('bg'),
+                                              undo=False, autoseparators=False)
+        self.completion_text_widget.pack(fill=tk.BOTH, expand=True)
+        
+        return header, completion_frame
+    
+    def step_completion(self):
+        """Completion step"""
         if self.installation_successful:
-            completion_text = f"""✅ Installation completed successfully!
-
-Installed Components:
-{self.get_installed_components_text()}
-
-What's Next:
-• Launch the application using: python launcher.py
-• Configure cameras: python launcher.py --configure  
-• Try demo mode: python launcher.py --demo
-• Read the documentation: README.md
-
-The Automated Followspot System is now ready to use!"""
-
-            # Add launch button
-            button_frame = ttk.Frame(completion_frame)
-            button_frame.pack(fill=tk.X, pady=(0, 10))
-            
-            ttk.Button(button_frame, text="Launch Application Now", 
-                      command=self.launch_application,
-                      style='WizardButton.TButton').pack(side=tk.LEFT)
+            self.completion_title.config(text="Installation Complete")
+            self.completion_subtitle.config(
+                text="The Automated Followspot System has been successfully installed")
             
-            ttk.Button(button_frame, text="Open Documentation", 
-                      command=self.open_documentation,
-                      style='WizardButton.TButton').pack(side=tk.LEFT, padx=(10, 0))
+            self.completion_buttons.pack(fill=tk.X, pady=(0, 10), before=self.completion_text_widget)
         else:
-            completion_text = """❌ Installation failed!
-
-Please check the installation log above for error details.
-
-Troubleshooting:
-• Ensure you have a stable internet connection
-• Check that you have sufficient permissions
-• Verify Python 3.7+ is installed
-• Try running the installer as administrator (Windows) or with sudo (Linux/Mac)
-
-For help, visit: https://github.com/Stavro-Purdie/Automated-Followspot-System/issues"""
+            self.completion_title.config(text="Installation Failed")
+            self.completion_subtitle.config(text="The installation encountered errors")
+            
+            self.completion_buttons.pack_forget()
         
-        text_widget = tk.Text(completion_frame, wrap=tk.WORD, height=12, width=60,
-                             font=('Arial', 10), relief=tk.FLAT, bg=self.root.cget('bg'))
-        text_widget.pack(fill=tk.BOTH, expand=True)
-        text_widget.insert(tk.END, completion_text)
-        text_widget.config(state=tk.DISABLED)
+        self.completion_text_widget.config(state=tk.NORMAL)
+        self.completion_text_widget.delete('1.0', tk.END)
+        self.completion_text_widget.insert('1.0', self._completion_text)
+        self.completion_text_widget.config(state=tk.DISABLED)
     
-    def get_installed_components_text(self):
-        """Get text describing installed components"""
+    @functools.cached_property
+    def _installed_components_text(self):
+        """Text describing installed components"""
         components = []
         
         if self.user_choices['stack_type'] in ['control', 'both']:
@@ -874,25 +1163,34 @@ For help, visit: https://github.com/Stavro-Purdie/Automated-Followspot-System/is
     def launch_application(self):
         """Launch the main application"""
         try:
-            launcher_script = Path(__file__).parent / "launcher.py"
-            subprocess.Popen([sys.executable, str(launcher_script)])
+            subprocess.Popen([sys.executable, str(_LAUNCHER)])
             self.log("🚀 Launching main application...")
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror("Launch Error", f"Could not launch application: {e}")
     
+    def launch_and_exit(self):
+        """Close the wizard and replace this process with the main application"""
+        self.root.destroy()
+        try:
+            os.execv(sys.executable, [sys.executable, str(_LAUNCHER)])
+        except Exception as e:
+            print(f"❌ Could not launch application: {e}")
+            sys.exit(1)
+    
     def open_documentation(self):
         """Open documentation"""
+        import webbrowser
         try:
-            readme_file = Path(__file__).parent / "README.md"
+            readme_file = _README
             if readme_file.exists():
                 # Try to open with default application
-                import platform
-                if platform.system() == 'Darwin':  # macOS
-                    subprocess.run(['open', str(readme_file)])
-                elif platform.system() == 'Windows':
-                    subprocess.run(['start', str(readme_file)], shell=True)
+                if _SYSTEM == 'Darwin':  # macOS
+                    subprocess.run(['open', str(readme_file)], check=False, start_new_session=True)
+                elif _SYSTEM == 'Windows':
+                    os.startfile(str(readme_file))
                 else:  # Linux
-                    subprocess.run(['xdg-open', str(readme_file)])
+                    subprocess.Popen(['xdg-open', str(readme_file)], start_new_session=True)
             else:
                 webbrowser.open("https://github.com/Stavro-Purdie/Automated-Followspot-System")
         except Exception as e:
@@ -6,17 +6,133 @@ Provides graphical interface for installation, configuration, and management of
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
-import json
+import tkinter.font as tkfont
 import os
+import re
+import codecs
 import sys
 import subprocess
 import threading
+import concurrent.futures
 import time
 import platform
 from pathlib import Path
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 import queue
 import webbrowser
+import importlib
+import importlib.util
+import functools
+from collections import deque
+
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# Scrollback kept in the launcher terminal (and in saved logs)
+MAX_TERMINAL_LINES = 2000
+
+# Shared worker pool for installer and status window background jobs
+_BG_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='fs-bg')
+
+# Requirement-to-module table shared with launcher.py
+from dependency_names import IMPORT_NAMES as _IMPORT_NAMES
+
+# Distribution name at the start of a requirements line
+_REQ_RE = re.compile(r'^([A-Za-z0-9_.\-]+)')
+
+
+
+def _dumps(obj):
+    """Serialize a config dict to indented JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _loads(data):
+    """Parse JSON bytes into a config dict"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _default_config():
+    """Build a fresh default configuration, stamped with the current time"""
+    return {
+        "system_info": {
+            "version": "1.0.0",
+            "last_updated": datetime.now().isoformat(),
+            "os_info": platform.platform(),
+            "installation_path": str(Path(__file__).parent.absolute())
+        },
+        "installations": {
+            "control_stack": {
+                "installed": False,
+                "version": None,
+                "install_date": None,
+                "dependencies_verified": False,
+                "last_dependency_check": None
+            },
+            "node_stack": {
+                "installed": False,
+                "version": None,
+                "install_date": None,
+                "dependencies_verified": False,
+                "last_dependency_check": None,
+                "cron_enabled": False
+            }
+        },
+        "settings": {
+            "auto_dependency_check": True,
+            "check_interval_days": 7,
+            "allow_concurrent_stacks": False,
+            "debug_mode": False
+        }
+    }
+
+
+def _trim_text(widget, max_lines=MAX_TERMINAL_LINES):
+    """Drop the oldest lines of a Text widget in one delete once it exceeds max_lines"""
+    line_count = int(widget.index('end-1c').split('.')[0])
+    if line_count > max_lines:
+        widget.delete('1.0', f'{line_count - max_lines + 1}.0')
+
+
+@functools.lru_cache(maxsize=1)
+def _is_raspberry_pi():
+    """Check /proc/cpuinfo for a Raspberry Pi (fixed for the life of the process)"""
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            cpuinfo = f.read()
+        return 'BCM' in cpuinfo or 'Raspberry Pi' in cpuinfo
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_platform_info():
+    """Collect the Python and OS details shown in the status window (fixed for the life of the process)"""
+    return (
+        ("Python Information", (
+            ("Version", sys.version),
+            ("Executable", sys.executable),
+            ("Platform", sys.platform),
+        )),
+        ("Operating System", (
+            ("System", platform.system()),
+            ("Release", platform.release()),
+            ("Version", platform.version()),
+            ("Machine", platform.machine()),
+            ("Processor", platform.processor()),
+        )),
+    )
+
 
 class LauncherGUI:
     def __init__(self):
@@ -25,83 +141,96 @@ class LauncherGUI:
         self.root.geometry("900x700")
         self.root.resizable(True, True)
         
+        # Project paths, resolved once
+        base = Path(__file__).resolve().parent.parent
+        self.paths = SimpleNamespace(
+            base=base,
+            control_req=base / "control" / "requirements.txt",
+            node_req=base / "node" / "requirements.txt",
+            control_main=base / "control" / "main.py",
+            camera_config_gui=base / "control" / "camera_config_gui.py",
+            node_server=base / "node" / "server.py",
+            camera_config=base / "config" / "camera_config.json",
+            launcher_config=base / "config" / "launcher_config.json"
+        )
+        
         # Initialize configuration
-        self.config_file = Path(__file__).parent.parent / "config" / "launcher_config.json"
+        self.config_file = self.paths.launcher_config
         self.config = self.load_config()
+        self._save_pending = False
+        self._ui_state = None
+        
+        # Parsed requirements: stack_type -> (requirements mtime, module names)
+        self._dep_cache = {}
+        
+        # One long-lived worker runs dependency checks; overlapping requests are coalesced
+        self._dep_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='dep-check')
+        self._dep_future = None
+        self._dep_rerun = False
         
         # Terminal output queue for installations
         self.terminal_queue = queue.Queue()
+        self.terminal_lines = deque(maxlen=MAX_TERMINAL_LINES)
+        self._terminal_partial = ""  # Output after the last newline, held until its line completes
         
         # Setup GUI
         self.setup_styles()
         self.create_widgets()
         self.update_ui_state()
         
+        # Flush queued terminal output on a fixed cadence
+        self.root.after(50, self._drain_terminal)
+        
         # Start periodic checks
-        self.root.after(1000, self.periodic_checks)
+        self._periodic_job = self.root.after(1000, self.periodic_checks)
     
     def load_config(self):
         """Load launcher configuration"""
-        default_config = {
-            "system_info": {
-                "version": "1.0.0",
-                "last_updated": datetime.now().isoformat(),
-                "os_info": platform.platform(),
-                "installation_path": str(Path(__file__).parent.absolute())
-            },
-            "installations": {
-                "control_stack": {
-                    "installed": False,
-                    "version": None,
-                    "install_date": None,
-                    "dependencies_verified": False,
-                    "last_dependency_check": None
-                },
-                "node_stack": {
-                    "installed": False,
-                    "version": None,
-                    "install_date": None,
-                    "dependencies_verified": False,
-                    "last_dependency_check": None,
-                    "cron_enabled": False
-                }
-            },
-            "settings": {
-                "auto_dependency_check": True,
-                "check_interval_days": 7,
-                "allow_concurrent_stacks": False,
-                "debug_mode": False
-            }
-        }
-        
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                config = _loads(self.config_file.read_bytes())
                 # Merge with defaults to ensure all keys exist
-                for key in default_config:
+                for key, default in _default_config().items():
                     if key not in config:
-                        config[key] = default_config[key]
-                    elif isinstance(default_config[key], dict):
-                        for subkey in default_config[key]:
+                        config[key] = default
+                    elif isinstance(default, dict):
+                        for subkey, subdefault in default.items():
                             if subkey not in config[key]:
-                                config[key][subkey] = default_config[key][subkey]
+                                config[key][subkey] = subdefault
                 return config
             except Exception as e:
                 messagebox.showerror("Configuration Error", f"Failed to load config: {e}")
-                return default_config
+                return _default_config()
         else:
             # Create config directory if it doesn't exist
             Path(self.config_file).parent.mkdir(exist_ok=True)
-            return default_config
+            return _default_config()
     
     def save_config(self):
-        """Save launcher configuration"""
+        """Save launcher configuration (coalesces bursts of changes into one write)"""
+        if not self._save_pending:
+            self._save_pending = True
+            self.root.after(500, self._flush_config)
+    
+    def _flush_config(self, interactive=True):
+        """Write the configuration to disk atomically"""
+        if not self._save_pending:
+            return
+        self._save_pending = False
+        
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            tmp_file = self.config_file.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(self.config))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
-            messagebox.showerror("Configuration Error", f"Failed to save config: {e}")
+            if interactive:
+                messagebox.showerror("Configuration Error", f"Failed to save config: {e}")
+            else:
+                # The root window is gone, so there is nowhere to show a dialog
+                print(f"❌ Failed to save config: {e}")
     
     def setup_styles(self):
         """Setup custom styles for the GUI"""
@@ -118,11 +247,23 @@ class LauncherGUI:
             'text': '#333333'
         }
         
+        # Named fonts, resolved once and shared by every style that uses them
+        self.fonts = {
+            'title': tkfont.Font(family='Arial', size=16, weight='bold'),
+            'subtitle': tkfont.Font(family='Arial', size=12, weight='bold'),
+            'body': tkfont.Font(family='Arial', size=10),
+            'body_bold': tkfont.Font(family='Arial', size=10, weight='bold')
+        }
+        
         # Configure styles
-        self.style.configure('Title.TLabel', font=('Arial', 16, 'bold'))
-        self.style.configure('Subtitle.TLabel', font=('Arial', 12, 'bold'))
-        self.style.configure('Status.TLabel', font=('Arial', 10))
-        self.style.configure('Primary.TButton', font=('Arial', 10, 'bold'))
+        style_spec = {
+            'Title.TLabel': {'font': self.fonts['title']},
+            'Subtitle.TLabel': {'font': self.fonts['subtitle']},
+            'Status.TLabel': {'font': self.fonts['body']},
+            'Primary.TButton': {'font': self.fonts['body_bold']}
+        }
+        for style_name, options in style_spec.items():
+            self.style.configure(style_name, **options)
     
     def create_widgets(self):
         """Create the main GUI widgets"""
@@ -305,101 +446,138 @@ class LauncherGUI:
     
     def update_ui_state(self):
         """Update UI state based on current configuration"""
-        control_installed = self.config['installations']['control_stack']['installed']
-        node_installed = self.config['installations']['node_stack']['installed']
-        
-        # Update status labels
-        if control_installed:
-            version = self.config['installations']['control_stack'].get('version', 'Unknown')
-            self.control_status_label.config(text=f"Control Stack: Installed (v{version})")
-        else:
-            self.control_status_label.config(text="Control Stack: Not Installed")
-        
-        if node_installed:
-            version = self.config['installations']['node_stack'].get('version', 'Unknown')
-            self.node_status_label.config(text=f"Node Stack: Installed (v{version})")
-        else:
-            self.node_status_label.config(text="Node Stack: Not Installed")
-        
-        # Show/hide appropriate frames
-        if not control_installed and not node_installed:
-            self.install_frame.grid()
-            self.control_frame.grid_remove()
-            self.node_frame.grid_remove()
-        else:
-            self.install_frame.grid_remove()
-            if control_installed:
-                self.control_frame.grid()
-            else:
-                self.control_frame.grid_remove()
-            if node_installed:
-                self.node_frame.grid()
-                # Update cron checkbox
-                self.cron_var.set(self.config['installations']['node_stack'].get('cron_enabled', False))
-            else:
-                self.node_frame.grid_remove()
+        control = self.config['installations']['control_stack']
+        node = self.config['installations']['node_stack']
+        state = (control['installed'], node['installed'],
+                 control.get('version', 'Unknown'), node.get('version', 'Unknown'),
+                 node.get('cron_enabled', False))
+        
+        # Only touch widgets whose part of the state actually changed
+        if state != self._ui_state:
+            previous = self._ui_state or (None,) * len(state)
+            self._ui_state = state
+            control_installed, node_installed, control_version, node_version, cron_enabled = state
+            
+            # Update status labels
+            if (control_installed, control_version) != (previous[0], previous[2]):
+                if control_installed:
+                    self._set_label_text(self.control_status_label, f"Control Stack: Installed (v{control_version})")
+                else:
+                    self._set_label_text(self.control_status_label, "Control Stack: Not Installed")
+            
+            if (node_installed, node_version) != (previous[1], previous[3]):
+                if node_installed:
+                    self._set_label_text(self.node_status_label, f"Node Stack: Installed (v{node_version})")
+                else:
+                    self._set_label_text(self.node_status_label, "Node Stack: Not Installed")
+            
+            # Show/hide appropriate frames
+            if (control_installed, node_installed) != (previous[0], previous[1]):
+                if not control_installed and not node_installed:
+                    self.install_frame.grid()
+                    self.control_frame.grid_remove()
+                    self.node_frame.grid_remove()
+                else:
+                    self.install_frame.grid_remove()
+                    if control_installed:
+                        self.control_frame.grid()
+                    else:
+                        self.control_frame.grid_remove()
+                    if node_installed:
+                        self.node_frame.grid()
+                    else:
+                        self.node_frame.grid_remove()
+            
+            # Update cron checkbox
+            if node_installed and (node_installed, cron_enabled) != (previous[1], previous[4]):
+                self.cron_var.set(cron_enabled)
         
         # Update dependencies status
         self.check_dependencies_async()
     
+    @staticmethod
+    def _set_label_text(label, text):
+        """Set a label's text only if it differs, avoiding a needless redraw"""
+        if label.cget('text') != text:
+            label.config(text=text)
+    
     def check_dependencies_async(self):
-        """Check dependencies in background thread"""
-        def check_deps():
-            try:
-                # Check control dependencies
-                if self.config['installations']['control_stack']['installed']:
-                    control_deps = self.check_dependencies('control')
-                else:
-                    control_deps = True
-                
-                # Check node dependencies
-                if self.config['installations']['node_stack']['installed']:
-                    node_deps = self.check_dependencies('node')
-                else:
-                    node_deps = True
-                
-                # Update UI
-                self.root.after(0, self.update_deps_status, control_deps and node_deps)
-                
-            except Exception as e:
-                self.log_to_terminal(f"Error checking dependencies: {e}")
-                self.root.after(0, self.update_deps_status, False)
+        """Check dependencies on the background worker"""
+        if self._dep_future is not None and not self._dep_future.done():
+            # Run again once the current check finishes so this request isn't lost
+            self._dep_rerun = True
+            return
         
-        threading.Thread(target=check_deps, daemon=True).start()
+        self._dep_future = self._dep_executor.submit(self._check_installed_dependencies)
+        self._dep_future.add_done_callback(
+            lambda future: self.root.after(0, self._on_deps_checked, future))
+    
+    def _on_deps_checked(self, future):
+        """Apply a finished dependency check and start any check requested meanwhile"""
+        self.update_deps_status(future.result())
+        
+        if self._dep_rerun:
+            self._dep_rerun = False
+            self.check_dependencies_async()
+    
+    def _check_installed_dependencies(self):
+        """Check dependencies for every installed stack (runs on the worker)"""
+        try:
+            # Check control dependencies
+            if self.config['installations']['control_stack']['installed']:
+                control_deps = self.check_dependencies('control')
+            else:
+                control_deps = True
+            
+            # Check node dependencies
+            if self.config['installations']['node_stack']['installed']:
+                node_deps = self.check_dependencies('node')
+            else:
+                node_deps = True
+            
+            return control_deps and node_deps
+            
+        except Exception as e:
+            self.log_to_terminal(f"Error checking dependencies: {e}")
+            return False
     
     def check_dependencies(self, stack_type):
         """Check if dependencies are installed for given stack"""
         try:
             if stack_type == 'control':
-                requirements_file = Path(__file__).parent.parent / "control" / "requirements.txt"
+                requirements_file = self.paths.control_req
             else:
-                requirements_file = Path(__file__).parent.parent / "node" / "requirements.txt"
+                requirements_file = self.paths.node_req
             
             if not requirements_file.exists():
                 return False
             
-            # Read requirements
-            with open(requirements_file, 'r') as f:
-                requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            
-            # Check each requirement
-            for requirement in requirements:
-                try:
-                    # Simple package name extraction (handles basic cases)
-                    package_name = requirement.split('>=')[0].split('==')[0].split('[')[0].strip()
-                    
-                    if package_name == 'opencv-python':
-                        import cv2
-                    elif package_name == 'pillow':
-                        from PIL import Image
-                    elif package_name == 'picamera2':
-                        # Skip picamera2 on non-Pi systems
-                        if not self.is_raspberry_pi():
+            # Reuse the parsed module names while requirements.txt is unchanged
+            mtime = requirements_file.stat().st_mtime
+            cached = self._dep_cache.get(stack_type)
+            if cached and cached[0] == mtime:
+                module_names = cached[1]
+            else:
+                # Read requirements
+                module_names = []
+                with open(requirements_file, 'r') as f:
+                    for line in f:
+                        match = _REQ_RE.match(line.strip())
+                        if not match:
                             continue
-                        import picamera2
-                    else:
-                        __import__(package_name.replace('-', '_'))
-                except ImportError:
+                        package_name = match.group(1).lower()
+                        module_names.append(_IMPORT_NAMES.get(package_name, package_name.replace('-', '_')))
+                self._dep_cache[stack_type] = (mtime, module_names)
+            
+            # Pick up packages installed since the last check
+            importlib.invalidate_caches()
+            
+            # find_spec locates each package without executing it, so this runs on every check
+            for module_name in module_names:
+                if module_name == 'picamera2' and not _is_raspberry_pi():
+                    # Skip picamera2 on non-Pi systems
+                    continue
+                if importlib.util.find_spec(module_name) is None:
                     return False
             
             return True
@@ -410,38 +588,44 @@ class LauncherGUI:
     
     def is_raspberry_pi(self):
         """Check if running on Raspberry Pi"""
-        try:
-            with open('/proc/cpuinfo', 'r') as f:
-                cpuinfo = f.read()
-            return 'BCM' in cpuinfo or 'Raspberry Pi' in cpuinfo
-        except:
-            return False
+        return _is_raspberry_pi()
     
     def update_deps_status(self, deps_ok):
         """Update dependencies status in UI"""
         if deps_ok:
-            self.deps_status_label.config(text="Dependencies: OK")
+            self._set_label_text(self.deps_status_label, "Dependencies: OK")
         else:
-            self.deps_status_label.config(text="Dependencies: Missing/Issues")
+            self._set_label_text(self.deps_status_label, "Dependencies: Missing/Issues")
         
         # Update last check time
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.check_time_label.config(text=f"Last Check: {now}")
+        self._set_label_text(self.check_time_label, f"Last Check: {now}")
         
-        # Update config
+        # Update config, but only write it out when the result or the check date changed
+        changed = False
         for stack in ['control_stack', 'node_stack']:
-            if self.config['installations'][stack]['installed']:
-                self.config['installations'][stack]['dependencies_verified'] = deps_ok
-                self.config['installations'][stack]['last_dependency_check'] = now
-        
-        self.save_config()
+            stack_info = self.config['installations'][stack]
+            if stack_info['installed']:
+                previous_check = stack_info.get('last_dependency_check') or ""
+                if stack_info.get('dependencies_verified') != deps_ok or previous_check[:10] != now[:10]:
+                    changed = True
+                stack_info['dependencies_verified'] = deps_ok
+                stack_info['last_dependency_check'] = now
+        
+        if changed:
+            self.save_config()
     
     def periodic_checks(self):
-        """Perform periodic system checks"""
+        """Perform periodic system checks, sleeping until the next one is due"""
+        # Idle for an hour when auto-checking is off or nothing is installed
+        delay_ms = 3600000
+        
         if self.config['settings']['auto_dependency_check']:
             last_check = None
+            any_installed = False
             for stack in ['control_stack', 'node_stack']:
                 if self.config['installations'][stack]['installed']:
+                    any_installed = True
                     check_date = self.config['installations'][stack].get('last_dependency_check')
                     if check_date:
                         try:
@@ -452,22 +636,60 @@ class LauncherGUI:
                             pass
             
             # Check if we need to run dependency check
-            if last_check is None or (datetime.now() - last_check).days >= self.config['settings']['check_interval_days']:
+            interval = timedelta(days=self.config['settings']['check_interval_days'])
+            if last_check is None or datetime.now() - last_check >= interval:
                 self.check_dependencies_async()
+                last_check = datetime.now()
+            
+            if any_installed:
+                # Sleep until the next check is due, between a minute and six hours
+                next_due = last_check + interval
+                delay_ms = int((next_due - datetime.now()).total_seconds() * 1000)
+                delay_ms = min(max(delay_ms, 60000), 6 * 3600000)
         
         # Schedule next check
-        self.root.after(60000, self.periodic_checks)  # Check every minute
+        self._periodic_job = self.root.after(delay_ms, self.periodic_checks)
+    
+    def reschedule_checks(self):
+        """Re-run the periodic check scheduling now (e.g. after install/uninstall or settings change)"""
+        self.root.after_cancel(self._periodic_job)
+        self._periodic_job = self.root.after_idle(self.periodic_checks)
     
     def log_to_terminal(self, message):
-        """Add message to terminal output"""
+        """Queue a message for the terminal output (safe from any thread; the drainer touches Tk)"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.terminal_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.terminal_text.see(tk.END)
-        self.root.update_idletasks()
+        self.terminal_queue.put(f"[{timestamp}] {message}\n")
+    
+    def _drain_terminal(self):
+        """Flush queued terminal messages in one insert (runs on main thread)"""
+        lines = []
+        while True:
+            try:
+                lines.append(self.terminal_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        if lines:
+            text = "".join(lines)
+            
+            # Keep whole lines in the scrollback; script output can end mid-line
+            pieces = (self._terminal_partial + text).split('\n')
+            self._terminal_partial = pieces.pop()
+            self.terminal_lines.extend(piece + '\n' for piece in pieces)
+            self.terminal_text.insert(tk.END, text)
+            
+            # Trim old output so the widget stays cheap to redraw
+            _trim_text(self.terminal_text)
+            
+            self.terminal_text.see(tk.END)
+        
+        self.root.after(50, self._drain_terminal)
     
     def clear_terminal(self):
         """Clear terminal output"""
         self.terminal_text.delete(1.0, tk.END)
+        self.terminal_lines.clear()
+        self._terminal_partial = ""
     
     def save_terminal_log(self):
         """Save terminal log to file"""
@@ -478,7 +700,7 @@ class LauncherGUI:
         if filename:
             try:
                 with open(filename, 'w') as f:
-                    f.write(self.terminal_text.get(1.0, tk.END))
+                    f.write("".join(self.terminal_lines) + self._terminal_partial)
                 messagebox.showinfo("Success", f"Log saved to {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save log: {e}")
@@ -492,58 +714,68 @@ class LauncherGUI:
         """Install node stack with GUI installer"""
         self.run_installer("node")
     
-    def run_installer(self, stack_type):
+    def run_installer(self, stack_type, repair_mode=False, reinstall_mode=False):
         """Run installer for specified stack type"""
-        installer_window = InstallerWindow(self, stack_type)
+        installer_window = InstallerWindow(self, stack_type, repair_mode=repair_mode, reinstall_mode=reinstall_mode)
         installer_window.show()
     
     # Control stack methods
     def launch_configuration(self):
         """Launch camera configuration GUI"""
-        script_path = Path(__file__).parent.parent / "control" / "camera_config_gui.py"
+        script_path = self.paths.camera_config_gui
         self.run_script(script_path, "Camera Configuration")
     
     def launch_offline_mode(self):
         """Launch control stack in offline/demo mode"""
-        script_path = Path(__file__).parent.parent / "control" / "main.py"
+        script_path = self.paths.control_main
         self.run_script(script_path, "Offline Mode", ["--demo"])
     
     def launch_live_mode(self):
         """Launch control stack in live mode"""
         # Check if configuration exists
-        config_path = Path(__file__).parent.parent / "config" / "camera_config.json"
+        config_path = self.paths.camera_config
         if not config_path.exists():
-            if messagebox.askyesno("Configuration Missing", 
-                                 "No camera configuration found. Would you like to configure cameras first?"):
-                self.launch_configuration()
-                return
+            ConfirmDialog(self.root, "Configuration Missing",
+                          "No camera configuration found. Would you like to configure cameras first?",
+                          on_yes=self.launch_configuration, on_no=self._start_live_mode)
+            return
         
-        script_path = Path(__file__).parent.parent / "control" / "main.py"
+        self._start_live_mode()
+    
+    def _start_live_mode(self):
+        """Start the control stack in live mode"""
+        config_path = self.paths.camera_config
+        script_path = self.paths.control_main
         # Launch directly into live mode without showing the connection dialog
         args = ["--config", str(config_path), "--no-dialog"]
         self.run_script(script_path, "Live Camera Tracking", args=args)
     
     def repair_control(self):
         """Repair control stack installation"""
-        if messagebox.askyesno("Repair Control Stack", 
-                             "This will reinstall dependencies and verify the installation. Continue?"):
-            self.run_installer("control", repair_mode=True)
+        ConfirmDialog(self.root, "Repair Control Stack",
+                      "This will reinstall dependencies and verify the installation. Continue?",
+                      on_yes=lambda: self.run_installer("control", repair_mode=True))
     
     def uninstall_control(self):
         """Uninstall control stack"""
-        if messagebox.askyesno("Uninstall Control Stack", 
-                             "This will remove the control stack installation. Continue?"):
-            self.config['installations']['control_stack']['installed'] = False
-            self.config['installations']['control_stack']['version'] = None
-            self.config['installations']['control_stack']['install_date'] = None
-            self.save_config()
-            self.update_ui_state()
-            self.log_to_terminal("Control stack uninstalled")
+        ConfirmDialog(self.root, "Uninstall Control Stack",
+                      "This will remove the control stack installation. Continue?",
+                      on_yes=self._do_uninstall_control)
+    
+    def _do_uninstall_control(self):
+        """Remove the control stack installation once confirmed"""
+        self.config['installations']['control_stack']['installed'] = False
+        self.config['installations']['control_stack']['version'] = None
+        self.config['installations']['control_stack']['install_date'] = None
+        self.save_config()
+        self.update_ui_state()
+        self.reschedule_checks()
+        self.log_to_terminal("Control stack uninstalled")
     
     # Node stack methods
     def start_node_server(self):
         """Start node server"""
-        script_path = Path(__file__).parent.parent / "node" / "server.py"
+        script_path = self.paths.node_server
         self.run_script(script_path, "Node Server", background=True)
     
     def stop_node_server(self):
@@ -568,27 +800,32 @@ class LauncherGUI:
     
     def repair_node(self):
         """Repair node stack installation"""
-        if messagebox.askyesno("Repair Node Stack", 
-                             "This will reinstall dependencies and verify the installation. Continue?"):
-            self.run_installer("node", repair_mode=True)
+        ConfirmDialog(self.root, "Repair Node Stack",
+                      "This will reinstall dependencies and verify the installation. Continue?",
+                      on_yes=lambda: self.run_installer("node", repair_mode=True))
     
     def reinstall_node(self):
         """Reinstall node stack"""
-        if messagebox.askyesno("Reinstall Node Stack", 
-                             "This will completely reinstall the node stack. Continue?"):
-            self.run_installer("node", reinstall_mode=True)
+        ConfirmDialog(self.root, "Reinstall Node Stack",
+                      "This will completely reinstall the node stack. Continue?",
+                      on_yes=lambda: self.run_installer("node", reinstall_mode=True))
     
     def uninstall_node(self):
         """Uninstall node stack"""
-        if messagebox.askyesno("Uninstall Node Stack", 
-                             "This will remove the node stack installation. Continue?"):
-            self.config['installations']['node_stack']['installed'] = False
-            self.config['installations']['node_stack']['version'] = None
-            self.config['installations']['node_stack']['install_date'] = None
-            self.config['installations']['node_stack']['cron_enabled'] = False
-            self.save_config()
-            self.update_ui_state()
-            self.log_to_terminal("Node stack uninstalled")
+        ConfirmDialog(self.root, "Uninstall Node Stack",
+                      "This will remove the node stack installation. Continue?",
+                      on_yes=self._do_uninstall_node)
+    
+    def _do_uninstall_node(self):
+        """Remove the node stack installation once confirmed"""
+        self.config['installations']['node_stack']['installed'] = False
+        self.config['installations']['node_stack']['version'] = None
+        self.config['installations']['node_stack']['install_date'] = None
+        self.config['installations']['node_stack']['cron_enabled'] = False
+        self.save_config()
+        self.update_ui_state()
+        self.reschedule_checks()
+        self.log_to_terminal("Node stack uninstalled")
     
     # General methods
     def show_about(self):
@@ -636,19 +873,30 @@ class LauncherGUI:
                             cwd=script_path.parent,
                             stdout=subprocess.PIPE,
                             stderr=subprocess.STDOUT,
-                            text=True,
-                            bufsize=1,
-                            universal_newlines=True
+                            bufsize=65536
                         )
                         
-                        for line in process.stdout:
-                            self.root.after(0, self.log_to_terminal, line.strip())
+                        # Hand output to the terminal drainer in chunks rather than line by line
+                        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+                        last_text = "\n"
+                        while True:
+                            chunk = process.stdout.read1(65536)
+                            text = decoder.decode(chunk, final=not chunk).replace('\r\n', '\n')
+                            if text:
+                                self.terminal_queue.put(text)
+                                last_text = text
+                            if not chunk:
+                                break
+                        
+                        # Keep the completion message on its own line
+                        if not last_text.endswith('\n'):
+                            self.terminal_queue.put('\n')
                         
                         process.wait()
-                        self.root.after(0, self.log_to_terminal, f"{description} completed with exit code {process.returncode}")
+                        self.log_to_terminal(f"{description} completed with exit code {process.returncode}")
                         
                     except Exception as e:
-                        self.root.after(0, self.log_to_terminal, f"Error running {description}: {e}")
+                        self.log_to_terminal(f"Error running {description}: {e}")
                 
                 threading.Thread(target=run_process, daemon=True).start()
                 
@@ -658,6 +906,59 @@ class LauncherGUI:
     def run(self):
         """Start the GUI application"""
         self.root.mainloop()
+        
+        # Don't lose a save that was still waiting on the debounce timer
+        self._flush_config(interactive=False)
+        self._dep_executor.shutdown(wait=False)
+        _BG_EXEC.shutdown(wait=False)
+
+
+class ConfirmDialog:
+    """Yes/No confirmation that reports the answer through callbacks instead of blocking"""
+    
+    def __init__(self, root, title, message, on_yes, on_no=None):
+        self.root = root
+        self.on_yes = on_yes
+        self.on_no = on_no
+        
+        self.window = tk.Toplevel(root)
+        self.window.title(title)
+        self.window.transient(root)
+        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self.answer_no)
+        
+        self.setup_ui(message)
+        
+        # Modal for input, but the Tk event loop keeps running underneath
+        self.window.grab_set()
+    
+    def setup_ui(self, message):
+        """Setup confirmation UI"""
+        main_frame = ttk.Frame(self.window, padding="20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(main_frame, text=message, wraplength=350, justify=tk.LEFT).pack(pady=(0, 20))
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X)
+        
+        ttk.Button(button_frame, text="Yes", command=self.answer_yes).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="No", command=self.answer_no).pack(side=tk.RIGHT)
+    
+    def answer_yes(self):
+        """Close the dialog and run the yes callback"""
+        self._close(self.on_yes)
+    
+    def answer_no(self):
+        """Close the dialog and run the no callback, if any"""
+        self._close(self.on_no)
+    
+    def _close(self, callback):
+        """Release the grab, close the dialog and schedule the callback"""
+        self.window.grab_release()
+        self.window.destroy()
+        if callback:
+            self.root.after(0, callback)
 
 
 class InstallerWindow:
@@ -666,6 +967,7 @@ class InstallerWindow:
     def __init__(self, parent, stack_type, repair_mode=False, reinstall_mode=False):
         self.parent = parent
         self.stack_type = stack_type
+        self._stack_key = f'{stack_type}_stack'
         self.repair_mode = repair_mode
         self.reinstall_mode = reinstall_mode
         
@@ -675,7 +977,17 @@ class InstallerWindow:
         self.window.transient(parent.root)
         self.window.grab_set()
         
+        # Log lines from the install thread, flushed to the terminal in batches
+        self._log_q = queue.Queue()
+        
+        # Background install job, stopped if the window is closed while it runs
+        self._install_future = None
+        self._process = None
+        self._closed = threading.Event()
+        
         self.setup_installer_ui()
+        self.window.bind("<Destroy>", self._on_destroy, add="+")
+        self.window.after(50, self._drain_logs)
     
     def setup_installer_ui(self):
         """Setup installer UI"""
@@ -709,10 +1021,27 @@ class InstallerWindow:
         self.close_button.pack(side=tk.RIGHT)
     
     def log(self, message):
-        """Log message to installer terminal"""
-        self.terminal.insert(tk.END, f"{message}\n")
-        self.terminal.see(tk.END)
-        self.window.update_idletasks()
+        """Queue a message for the installer terminal (safe from any thread)"""
+        self._log_q.put(message)
+    
+    def _drain_logs(self):
+        """Flush queued log lines into the terminal in one insert (runs on main thread)"""
+        if not self.window.winfo_exists():
+            return
+        
+        lines = []
+        while True:
+            try:
+                lines.append(self._log_q.get_nowait())
+            except queue.Empty:
+                break
+        
+        if lines:
+            self.terminal.insert(tk.END, "\n".join(lines) + "\n")
+            _trim_text(self.terminal)
+            self.terminal.see(tk.END)
+        
+        self.window.after(50, self._drain_logs)
     
     def start_installation(self):
         """Start the installation process"""
@@ -720,59 +1049,114 @@ class InstallerWindow:
         self.progress.start()
         
         def install_process():
-            try:
-                self.window.after(0, lambda: self.status_label.config(text="Installing dependencies..."))
-                
-                # Install dependencies
-                if self.stack_type == "control":
-                    requirements_file = Path(__file__).parent.parent / "control" / "requirements.txt"
-                else:
-                    requirements_file = Path(__file__).parent.parent / "node" / "requirements.txt"
-                
-                if requirements_file.exists():
-                    self.window.after(0, self.log, f"Installing dependencies from {requirements_file}")
-                    
-                    # Run pip install
-                    cmd = [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)]
-                    process = subprocess.Popen(
-                        cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        universal_newlines=True
-                    )
-                    
-                    for line in process.stdout:
-                        self.window.after(0, self.log, line.strip())
-                    
-                    process.wait()
-                    
-                    if process.returncode == 0:
-                        self.window.after(0, self.log, "Dependencies installed successfully")
-                    else:
-                        self.window.after(0, self.log, f"Dependency installation failed with code {process.returncode}")
-                        self.window.after(0, self.installation_failed)
-                        return
-                
-                # Mark as installed
-                self.window.after(0, lambda: self.status_label.config(text="Finalizing installation..."))
+            self._post(self._set_status, "Installing dependencies...")
+            
+            # Install dependencies
+            if self.stack_type == "control":
+                requirements_file = self.parent.paths.control_req
+            else:
+                requirements_file = self.parent.paths.node_req
+            
+            if requirements_file.exists():
+                self.log(f"Installing dependencies from {requirements_file}")
                 
-                install_date = datetime.now().isoformat()
-                self.parent.config['installations'][f'{self.stack_type}_stack']['installed'] = True
-                self.parent.config['installations'][f'{self.stack_type}_stack']['version'] = "1.0.0"
-                self.parent.config['installations'][f'{self.stack_type}_stack']['install_date'] = install_date
-                self.parent.config['installations'][f'{self.stack_type}_stack']['dependencies_verified'] = True
-                self.parent.config['installations'][f'{self.stack_type}_stack']['last_dependency_check'] = install_date
+                # Run pip install
+                cmd = [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)]
+                if self._closed.is_set():
+                    return False
+                process = self._process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    env={**os.environ, "PYTHONUNBUFFERED": "1"},
+                    creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+                )
+                if self._closed.is_set():
+                    process.terminate()  # Window closed while pip was starting
                 
-                self.parent.save_config()
+                # Line-buffered on both ends, so each pip line arrives as it is printed
+                while True:
+                    line = process.stdout.readline()
+                    if not line:
+                        break
+                    self.log(line.strip())
                 
-                self.window.after(0, self.installation_completed)
+                process.wait()
+                self._process = None
                 
-            except Exception as e:
-                self.window.after(0, self.log, f"Installation error: {e}")
-                self.window.after(0, self.installation_failed)
+                if self._closed.is_set():
+                    return False
+                if process.returncode == 0:
+                    self.log("Dependencies installed successfully")
+                else:
+                    self.log(f"Dependency installation failed with code {process.returncode}")
+                    return False
+            
+            # Mark as installed
+            self._post(self._set_status, "Finalizing installation...")
+            
+            install_date = datetime.now().isoformat()
+            stack_config = self.parent.config['installations'][self._stack_key]
+            stack_config['installed'] = True
+            stack_config['version'] = "1.0.0"
+            stack_config['install_date'] = install_date
+            stack_config['dependencies_verified'] = True
+            stack_config['last_dependency_check'] = install_date
+            
+            return True
+        
+        self._install_future = _BG_EXEC.submit(install_process)
+        self._install_future.add_done_callback(
+            lambda f: self._post(self._on_install_done, f))
+    
+    def _post(self, callback, *args):
+        """Schedule callback on the Tk thread (safe from any thread, even after the launcher closed)"""
+        try:
+            self.parent.root.after(0, callback, *args)
+        except (tk.TclError, RuntimeError):
+            pass  # Launcher is shutting down
+    
+    def _set_status(self, text):
+        """Update the status label if the window is still open"""
+        if self.window.winfo_exists():
+            self.status_label.config(text=text)
+    
+    def _on_destroy(self, event):
+        """Stop the install job when the window goes away"""
+        if event.widget is not self.window:
+            return
+        
+        self._closed.set()
+        if self._install_future is not None:
+            self._install_future.cancel()
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
+    
+    def _on_install_done(self, future):
+        """Route the finished install job to the completion or failure handler"""
+        try:
+            succeeded = future.result()
+        except concurrent.futures.CancelledError:
+            return
+        except Exception as e:
+            self.log(f"Installation error: {e}")
+            succeeded = False
         
-        threading.Thread(target=install_process, daemon=True).start()
+        # Record a finished install even if this window was closed meanwhile
+        if succeeded:
+            self.parent.save_config()
+            self.parent.update_ui_state()
+            self.parent.reschedule_checks()
+        
+        if not self.window.winfo_exists():
+            return
+        if succeeded:
+            self.installation_completed()
+        else:
+            self.installation_failed()
     
     def installation_completed(self):
         """Handle successful installation completion"""
@@ -780,9 +1164,6 @@ class InstallerWindow:
         self.status_label.config(text="Installation completed successfully!")
         self.log("Installation completed successfully!")
         self.close_button.config(state=tk.NORMAL)
-        
-        # Update parent UI
-        self.parent.update_ui_state()
     
     def installation_failed(self):
         """Handle installation failure"""
@@ -805,6 +1186,10 @@ class StatusWindow:
     
     def __init__(self, parent):
         self.parent = parent
+        # Read the in-memory config; the file on disk may lag behind a pending debounced save
+        self._config = parent.config
+        self._deps_future = None
+        self._closed = threading.Event()
         
         self.window = tk.Toplevel()
         self.window.title("System Status - Automated Followspot System")
@@ -818,6 +1203,16 @@ class StatusWindow:
         self.window.geometry(f"800x600+{x}+{y}")
         
         self.setup_ui()
+        self.window.bind("<Destroy>", self._on_destroy, add="+")
+    
+    def _on_destroy(self, event):
+        """Drop a queued dependency check when the window goes away"""
+        if event.widget is not self.window:
+            return
+        
+        self._closed.set()
+        if self._deps_future is not None:
+            self._deps_future.cancel()
     
     def setup_ui(self):
         """Setup status window UI"""
@@ -833,30 +1228,34 @@ class StatusWindow:
         notebook = ttk.Notebook(main_frame)
         notebook.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
         
-        # System Overview Tab
-        overview_frame = ttk.Frame(notebook)
-        notebook.add(overview_frame, text="System Overview")
-        self.create_system_overview_tab(overview_frame)
-        
-        # Installation Status Tab
-        install_frame = ttk.Frame(notebook)
-        notebook.add(install_frame, text="Installation Status")
-        self.create_installation_status_tab(install_frame)
-        
-        # Dependencies Tab
-        deps_frame = ttk.Frame(notebook)
-        notebook.add(deps_frame, text="Dependencies")
-        self.create_dependencies_tab(deps_frame)
-        
-        # System Information Tab
-        sysinfo_frame = ttk.Frame(notebook)
-        notebook.add(sysinfo_frame, text="System Information")
-        self.create_system_info_tab(sysinfo_frame)
+        # Tabs are added empty and filled in the first time they are selected
+        self._tab_builders = {}
+        self._built = set()
+        for text, builder in (("System Overview", self.create_system_overview_tab),
+                              ("Installation Status", self.create_installation_status_tab),
+                              ("Dependencies", self.create_dependencies_tab),
+                              ("System Information", self.create_system_info_tab)):
+            frame = ttk.Frame(notebook)
+            notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = (frame, builder)
+        
+        self.notebook = notebook
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
         
         # Close button
         close_button = ttk.Button(main_frame, text="Close", command=self.window.destroy)
         close_button.pack()
     
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab on first view"""
+        selected = self.notebook.select()
+        if not selected or selected in self._built:
+            return
+        self._built.add(selected)
+        frame, builder = self._tab_builders[selected]
+        builder(frame)
+    
     def create_system_overview_tab(self, parent):
         """Create system overview tab"""
         # Scrollable frame
@@ -873,15 +1272,18 @@ class StatusWindow:
         canvas.configure(yscrollcommand=scrollbar.set)
         
         # Load configuration
-        config = self.parent.load_config()
+        config = self._config
         
         # System Status Section
         status_frame = ttk.LabelFrame(scrollable_frame, text="System Status", padding=10)
         status_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Overall health indicator
-        control_installed = config.get("installations", {}).get("control_stack", {}).get("installed", False)
-        node_installed = config.get("installations", {}).get("node_stack", {}).get("installed", False)
+        installations = config.get("installations", {})
+        control_stack = installations.get("control_stack", {})
+        node_stack = installations.get("node_stack", {})
+        control_installed = control_stack.get("installed", False)
+        node_installed = node_stack.get("installed", False)
         
         if control_installed or node_installed:
             status_color = "green"
@@ -903,7 +1305,7 @@ class StatusWindow:
         if control_installed:
             ttk.Label(install_frame, text="✅ Control Stack: Installed", 
                      font=('Arial', 10)).pack(anchor=tk.W)
-            install_date = config.get("installations", {}).get("control_stack", {}).get("install_date")
+            install_date = control_stack.get("install_date")
             if install_date:
                 ttk.Label(install_frame, text=f"   Installed: {install_date[:10]}", 
                          font=('Arial', 9), foreground="gray").pack(anchor=tk.W)
@@ -914,7 +1316,7 @@ class StatusWindow:
         if node_installed:
             ttk.Label(install_frame, text="✅ Node Stack: Installed", 
                      font=('Arial', 10)).pack(anchor=tk.W)
-            install_date = config.get("installations", {}).get("node_stack", {}).get("install_date")
+            install_date = node_stack.get("install_date")
             if install_date:
                 ttk.Label(install_frame, text=f"   Installed: {install_date[:10]}", 
                          font=('Arial', 9), foreground="gray").pack(anchor=tk.W)
@@ -952,62 +1354,66 @@ class StatusWindow:
     
     def create_installation_status_tab(self, parent):
         """Create installation status tab"""
-        config = self.parent.load_config()
+        config = self._config
+        system_info = config.get("system_info", {})
+        installations = config.get("installations", {})
+        settings = config.get("settings", {})
         
         # Scrollable text widget
-        text_widget = scrolledtext.ScrolledText(parent, wrap=tk.WORD, font=('Consolas', 10))
+        text_widget = scrolledtext.ScrolledText(parent, wrap=tk.NONE, font=('Consolas', 10),
+                                                undo=False, autoseparators=False, maxundo=0)
         text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Format installation status
-        status_text = "AUTOMATED FOLLOWSPOT SYSTEM - INSTALLATION STATUS\n"
-        status_text += "=" * 60 + "\n\n"
-        
-        # System Info
-        system_info = config.get("system_info", {})
-        status_text += "System Information:\n"
-        status_text += f"  Version: {system_info.get('version', 'Unknown')}\n"
-        status_text += f"  Last Updated: {system_info.get('last_updated', 'Unknown')}\n"
-        status_text += f"  OS: {system_info.get('os_info', 'Unknown')}\n"
-        status_text += f"  Installation Path: {system_info.get('installation_path', 'Unknown')}\n\n"
+        lines = [
+            "AUTOMATED FOLLOWSPOT SYSTEM - INSTALLATION STATUS",
+            "=" * 60,
+            "",
+            # System Info
+            "System Information:",
+            f"  Version: {system_info.get('version', 'Unknown')}",
+            f"  Last Updated: {system_info.get('last_updated', 'Unknown')}",
+            f"  OS: {system_info.get('os_info', 'Unknown')}",
+            f"  Installation Path: {system_info.get('installation_path', 'Unknown')}",
+            "",
+        ]
         
         # Installation Status
-        installations = config.get("installations", {})
-        
         for stack_name, stack_info in installations.items():
-            stack_display = stack_name.replace('_', ' ').title()
-            status_text += f"{stack_display}:\n"
+            lines.append(f"{stack_name.replace('_', ' ').title()}:")
             
             if stack_info.get("installed", False):
-                status_text += "  Status: ✅ INSTALLED\n"
-                status_text += f"  Version: {stack_info.get('version', 'Unknown')}\n"
-                status_text += f"  Install Date: {stack_info.get('install_date', 'Unknown')}\n"
+                lines.append("  Status: ✅ INSTALLED")
+                lines.append(f"  Version: {stack_info.get('version', 'Unknown')}")
+                lines.append(f"  Install Date: {stack_info.get('install_date', 'Unknown')}")
                 
                 if stack_info.get("dependencies_verified", False):
-                    status_text += "  Dependencies: ✅ VERIFIED\n"
+                    lines.append("  Dependencies: ✅ VERIFIED")
                 else:
-                    status_text += "  Dependencies: ❌ NOT VERIFIED\n"
+                    lines.append("  Dependencies: ❌ NOT VERIFIED")
                 
                 last_check = stack_info.get("last_dependency_check")
                 if last_check:
-                    status_text += f"  Last Dependency Check: {last_check[:10]}\n"
+                    lines.append(f"  Last Dependency Check: {last_check[:10]}")
                 
                 if stack_name == "node_stack":
-                    cron_enabled = stack_info.get("cron_enabled", False)
-                    status_text += f"  Auto-start: {'✅ ENABLED' if cron_enabled else '❌ DISABLED'}\n"
+                    lines.append(f"  Auto-start: {'✅ ENABLED' if stack_info.get('cron_enabled', False) else '❌ DISABLED'}")
             else:
-                status_text += "  Status: ❌ NOT INSTALLED\n"
+                lines.append("  Status: ❌ NOT INSTALLED")
             
-            status_text += "\n"
+            lines.append("")
         
         # Settings
-        settings = config.get("settings", {})
-        status_text += "Settings:\n"
-        status_text += f"  Auto Dependency Check: {'Enabled' if settings.get('auto_dependency_check', True) else 'Disabled'}\n"
-        status_text += f"  Check Interval: {settings.get('check_interval_days', 7)} days\n"
-        status_text += f"  Allow Concurrent Stacks: {'Yes' if settings.get('allow_concurrent_stacks', False) else 'No'}\n"
-        status_text += f"  Debug Mode: {'Enabled' if settings.get('debug_mode', False) else 'Disabled'}\n"
-        
-        text_widget.insert(tk.END, status_text)
+        lines += [
+            "Settings:",
+            f"  Auto Dependency Check: {'Enabled' if settings.get('auto_dependency_check', True) else 'Disabled'}",
+            f"  Check Interval: {settings.get('check_interval_days', 7)} days",
+            f"  Allow Concurrent Stacks: {'Yes' if settings.get('allow_concurrent_stacks', False) else 'No'}",
+            f"  Debug Mode: {'Enabled' if settings.get('debug_mode', False) else 'Disabled'}",
+            "",
+        ]
+        
+        text_widget.insert(tk.END, "\n".join(lines))
         text_widget.config(state=tk.DISABLED)
     
     def create_dependencies_tab(self, parent):
@@ -1036,53 +1442,41 @@ class StatusWindow:
     
     def create_system_info_tab(self, parent):
         """Create system information tab"""
-        import platform
-        import sys
-        
         # Scrollable text widget
-        text_widget = scrolledtext.ScrolledText(parent, wrap=tk.WORD, font=('Consolas', 10))
+        text_widget = scrolledtext.ScrolledText(parent, wrap=tk.NONE, font=('Consolas', 10),
+                                                undo=False, autoseparators=False, maxundo=0)
         text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Gather system information
-        info_text = "SYSTEM INFORMATION\n"
-        info_text += "=" * 40 + "\n\n"
-        
-        info_text += "Python Information:\n"
-        info_text += f"  Version: {sys.version}\n"
-        info_text += f"  Executable: {sys.executable}\n"
-        info_text += f"  Platform: {sys.platform}\n\n"
-        
-        info_text += "Operating System:\n"
-        info_text += f"  System: {platform.system()}\n"
-        info_text += f"  Release: {platform.release()}\n"
-        info_text += f"  Version: {platform.version()}\n"
-        info_text += f"  Machine: {platform.machine()}\n"
-        info_text += f"  Processor: {platform.processor()}\n\n"
+        parts = ["SYSTEM INFORMATION\n", "=" * 40 + "\n\n"]
+        for section, fields in _cached_platform_info():
+            parts.append(f"{section}:\n")
+            parts.extend(f"  {label}: {value}\n" for label, value in fields)
+            parts.append("\n")
         
         # Disk space
         try:
             import shutil
             total, used, free = shutil.disk_usage(str(Path(__file__).parent))
-            info_text += "Disk Space:\n"
-            info_text += f"  Total: {total // (1024**3)} GB\n"
-            info_text += f"  Used: {used // (1024**3)} GB\n"
-            info_text += f"  Free: {free // (1024**3)} GB\n\n"
+            parts.append("Disk Space:\n")
+            parts.append(f"  Total: {total // (1024**3)} GB\n")
+            parts.append(f"  Used: {used // (1024**3)} GB\n")
+            parts.append(f"  Free: {free // (1024**3)} GB\n\n")
         except:
-            info_text += "Disk Space: Unable to determine\n\n"
+            parts.append("Disk Space: Unable to determine\n\n")
         
         # Project structure
-        info_text += "Project Structure:\n"
+        parts.append("Project Structure:\n")
         try:
             project_root = Path(__file__).parent
-            for item in sorted(project_root.iterdir()):
-                if item.is_dir():
-                    info_text += f"  📁 {item.name}/\n"
-                else:
-                    info_text += f"  📄 {item.name}\n"
+            with os.scandir(project_root) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            parts.extend(f"  📁 {entry.name}/\n" if entry.is_dir(follow_symlinks=False) else f"  📄 {entry.name}\n"
+                         for entry in entries)
         except:
-            info_text += "  Unable to read project structure\n"
+            parts.append("  Unable to read project structure\n")
         
-        text_widget.insert(tk.END, info_text)
+        text_widget.insert(tk.END, "".join(parts))
         text_widget.config(state=tk.DISABLED)
     
     def launch_installer_wizard(self):
@@ -1103,60 +1497,89 @@ class StatusWindow:
     
     def check_all_dependencies(self):
         """Check all dependencies and update display"""
-        self.deps_text.delete(1.0, tk.END)
-        self.deps_text.insert(tk.END, "Checking dependencies...\n")
-        self.deps_text.update()
+        # A check is already running; its result will refresh the display
+        if self._deps_future is not None and not self._deps_future.done():
+            return
+        
+        self._apply_deps_text("Checking dependencies...\n")
         
         # Run dependency check in background
-        threading.Thread(target=self._check_dependencies_background, daemon=True).start()
+        self._deps_future = _BG_EXEC.submit(self._check_dependencies_background)
     
     def _check_dependencies_background(self):
         """Background dependency check"""
         try:
-            result = self.parent.check_dependencies()
-            self.window.after(0, lambda: self.update_dependencies_display(result))
+            result = {}
+            for stack_type in ('control', 'node'):
+                if self._closed.is_set():
+                    return
+                try:
+                    result[f'{stack_type}_stack'] = {
+                        "all_satisfied": self.parent.check_dependencies(stack_type)
+                    }
+                except Exception as e:
+                    result[f'{stack_type}_stack'] = {"error": str(e)}
+            text = self._format_dependencies(result)
         except Exception as e:
-            self.window.after(0, lambda: self.deps_text.insert(tk.END, f"Error checking dependencies: {e}\n"))
+            text = f"Error checking dependencies: {e}\n"
+        
+        if self._closed.is_set():
+            return
+        try:
+            self.parent.root.after(0, self._apply_deps_text, text)
+        except (tk.TclError, RuntimeError):
+            pass  # Launcher is shutting down
     
-    def update_dependencies_display(self, check_result=None):
-        """Update dependencies display"""
-        if check_result is None:
-            self.deps_text.delete(1.0, tk.END)
-            self.deps_text.insert(tk.END, "Dependencies status will appear here after checking.\n\n")
-            self.deps_text.insert(tk.END, "Click 'Check All Dependencies' to scan for installed packages.")
+    def _apply_deps_text(self, text):
+        """Replace the dependencies display with text in a single write"""
+        if not self.window.winfo_exists():
             return
-        
         self.deps_text.delete(1.0, tk.END)
-        
-        # Format the dependency check results
+        self.deps_text.insert(tk.END, text)
+        _trim_text(self.deps_text)
+    
+    @staticmethod
+    def _format_dependencies(check_result):
+        """Format a dependency check result as display text"""
+        parts = []
         for stack_type, status in check_result.items():
             if stack_type == "overall_status":
                 continue
                 
             stack_display = stack_type.replace('_', ' ').title()
-            self.deps_text.insert(tk.END, f"{stack_display} Dependencies:\n")
-            self.deps_text.insert(tk.END, "=" * (len(stack_display) + 15) + "\n")
+            parts.append(f"{stack_display} Dependencies:\n")
+            parts.append("=" * (len(stack_display) + 15) + "\n")
             
             if "error" in status:
-                self.deps_text.insert(tk.END, f"❌ Error: {status['error']}\n\n")
+                parts.append(f"❌ Error: {status['error']}\n\n")
                 continue
             
             if status.get("all_satisfied", False):
-                self.deps_text.insert(tk.END, "✅ All dependencies satisfied\n\n")
+                parts.append("✅ All dependencies satisfied\n\n")
             else:
-                self.deps_text.insert(tk.END, "❌ Some dependencies missing\n\n")
+                parts.append("❌ Some dependencies missing\n\n")
             
             # List all dependencies
             for dep, info in status.get("dependencies", {}).items():
                 if info["satisfied"]:
-                    self.deps_text.insert(tk.END, f"  ✅ {dep}")
+                    parts.append(f"  ✅ {dep}")
                     if info.get("version"):
-                        self.deps_text.insert(tk.END, f" (v{info['version']})")
-                    self.deps_text.insert(tk.END, "\n")
+                        parts.append(f" (v{info['version']})")
+                    parts.append("\n")
                 else:
-                    self.deps_text.insert(tk.END, f"  ❌ {dep} - NOT INSTALLED\n")
+                    parts.append(f"  ❌ {dep} - NOT INSTALLED\n")
             
-            self.deps_text.insert(tk.END, "\n")
+            parts.append("\n")
+        return "".join(parts)
+    
+    def update_dependencies_display(self, check_result=None):
+        """Update dependencies display"""
+        if check_result is None:
+            self._apply_deps_text("Dependencies status will appear here after checking.\n\n"
+                                  "Click 'Check All Dependencies' to scan for installed packages.")
+            return
+        
+        self._apply_deps_text(self._format_dependencies(check_result))
     
     def install_missing_dependencies(self):
         """Install missing dependencies"""
@@ -1202,6 +1625,7 @@ class DiagnosticsWindow:
     def __init__(self, parent, stack_type):
         self.parent = parent
         self.stack_type = stack_type
+        self._stack_key = f'{stack_type}_stack'
         
         self.window = tk.Toplevel(parent.root)
         self.window.title(f"{stack_type.title()} Stack Diagnostics")
@@ -1235,8 +1659,8 @@ class DiagnosticsWindow:
     def log(self, message):
         """Log message to diagnostics output"""
         self.results_text.insert(tk.END, f"{message}\n")
+        _trim_text(self.results_text)
         self.results_text.see(tk.END)
-        self.window.update_idletasks()
     
     def run_diagnostics(self):
         """Run diagnostic tests"""
@@ -1244,7 +1668,7 @@ class DiagnosticsWindow:
         self.log(f"Running {self.stack_type} stack diagnostics...\n")
         
         # Check if stack is installed
-        if not self.parent.config['installations'][f'{self.stack_type}_stack']['installed']:
+        if not self.parent.config['installations'][self._stack_key]['installed']:
             self.log("❌ Stack not installed")
             return
         
@@ -1272,7 +1696,7 @@ class DiagnosticsWindow:
                 "node/requirements.txt"
             ]
         
-        base_path = Path(__file__).parent.parent
+        base_path = self.parent.paths.base
         for file_path in files_to_check:
             full_path = base_path / file_path
             if full_path.exists():
@@ -1402,6 +1826,7 @@ class SettingsWindow:
         self.parent.config['settings']['debug_mode'] = self.debug_var.get()
         
         self.parent.save_config()
+        self.parent.reschedule_checks()
         self.parent.log_to_terminal("Settings saved")
         self.window.destroy()
     
@@ -10,10 +10,13 @@ import sys
 import subprocess
 import argparse
 import json
+import importlib.util
 import platform
 from pathlib import Path
 from datetime import datetime
 
+from installer_scripts.dependency_names import IMPORT_NAMES
+
 try:
     import tkinter as tk
 except ImportError:
@@ -56,8 +59,7 @@ def load_launcher_config():
     
     if os.path.exists(config_file):
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = json.loads(Path(config_file).read_bytes().decode('utf-8'))
             # Merge with defaults to ensure all keys exist
             for key in default_config:
                 if key not in config:
@@ -73,8 +75,9 @@ def load_launcher_config():
     else:
         # Create default config file
         try:
-            with open(config_file, 'w') as f:
-                json.dump(default_config, f, indent=2)
+            payload = json.dumps(default_config, indent=2)
+            with open(config_file, 'wb', buffering=1 << 20) as f:
+                f.write(payload.encode('utf-8'))
             print(f"✅ Created launcher configuration: {config_file}")
         except Exception as e:
             print(f"⚠️  Could not create launcher config: {e}")
@@ -86,8 +89,14 @@ def save_launcher_config(config):
     try:
         # Ensure config directory exists
         Path(config_file).parent.mkdir(exist_ok=True)
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Serialize first so the file gets a single write, then swap it in atomically
+        payload = json.dumps(config, indent=2)
+        tmp_file = Path(config_file).with_suffix('.json.tmp')
+        with open(tmp_file, 'wb', buffering=1 << 20) as f:
+            f.write(payload.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, config_file)
         return True
     except Exception as e:
         print(f"❌ Error saving launcher config: {e}")
@@ -131,7 +140,11 @@ def check_stack_dependencies(stack_type):
     # Read requirements
     try:
         with open(requirements_file, 'r') as f:
-            requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+            requirements = []
+            for line in f:
+                requirement = line.strip()
+                if requirement and requirement[0] != '#':
+                    requirements.append(requirement)
     except Exception as e:
         print(f"❌ Error reading requirements for {stack_name}: {e}")
         return False
@@ -139,35 +152,17 @@ def check_stack_dependencies(stack_type):
     missing_packages = []
     
     for requirement in requirements:
-        package_name = None
-        try:
-            # Simple package name extraction
-            package_name = requirement.split('>=')[0].split('==')[0].split('[')[0].strip()
-            
-            if package_name == 'opencv-python':
-                import cv2
-            elif package_name == 'pillow':
-                from PIL import Image
-            elif package_name == 'picamera2':
-                # Skip picamera2 on non-Pi systems
-                if not is_raspberry_pi():
-                    continue
-                try:
-                    import picamera2
-                except ImportError:
-                    # Only add to missing if we're on a Pi
-                    if is_raspberry_pi():
-                        missing_packages.append(package_name)
-                    continue
-            elif package_name == 'cv2':
-                import cv2
-            elif package_name == 'PIL':
-                from PIL import Image
-            else:
-                __import__(package_name.replace('-', '_'))
-        except ImportError:
-            if package_name:
-                missing_packages.append(package_name)
+        # Simple package name extraction
+        package_name = requirement.split('>=')[0].split('==')[0].split('[')[0].strip()
+        
+        # Skip picamera2 on non-Pi systems
+        if package_name == 'picamera2' and not is_raspberry_pi():
+            continue
+        
+        # find_spec locates the package without importing it
+        module_name = IMPORT_NAMES.get(package_name.lower(), package_name.lower().replace('-', '_'))
+        if importlib.util.find_spec(module_name) is None:
+            missing_packages.append(package_name)
     
     if missing_packages:
         print(f"❌ {stack_name} - Missing required packages:")